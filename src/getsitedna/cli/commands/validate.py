@@ -1,6 +1,8 @@
 """Validation command for verifying analysis output quality."""
 
 import json
+import os
+import stat
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
@@ -54,8 +56,14 @@ class AnalysisValidator:
             }
         }
     
-    def validate_analysis_directory(self, analysis_dir: Path) -> Dict[str, Any]:
-        """Validate an entire analysis directory."""
+    def validate_analysis_directory(self, analysis_dir: Path,
+                                    parent_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
+        """Validate an entire analysis directory.
+        
+        Args:
+            analysis_dir: Directory containing analysis output
+            parent_stat: Already-taken stat of ``analysis_dir``, if the caller has one
+        """
         console.print(f"[bold blue]Validating analysis directory:[/bold blue] {analysis_dir}")
         
         validation_results = {
@@ -77,7 +85,7 @@ class AnalysisValidator:
             
             # Check directory structure
             task = progress.add_task("Validating directory structure...", total=None)
-            structure_results = self._validate_directory_structure(analysis_dir)
+            structure_results = self._validate_directory_structure(analysis_dir, parent_stat)
             validation_results["file_validation"] = structure_results
             progress.advance(task)
             
@@ -102,7 +110,8 @@ class AnalysisValidator:
         
         return validation_results
     
-    def _validate_directory_structure(self, analysis_dir: Path) -> Dict[str, Any]:
+    def _validate_directory_structure(self, analysis_dir: Path,
+                                      parent_stat: Optional[os.stat_result] = None) -> Dict[str, Any]:
         """Validate the directory structure and required files."""
         results = {
             "required_files_present": [],
@@ -112,33 +121,25 @@ class AnalysisValidator:
             "directory_score": 0.0
         }
         
-        if not analysis_dir.exists():
+        if parent_stat is None and not analysis_dir.exists():
             results["missing_files"].append("Analysis directory does not exist")
             return results
         
-        # Check required JSON files
+        # Check required JSON and Markdown files (one stat per file)
         required_json = self.validation_rules["output_files"]["required_json_files"]
-        for filename in required_json:
-            file_path = analysis_dir / filename
-            if file_path.exists():
-                results["required_files_present"].append(filename)
-                results["file_sizes"][filename] = file_path.stat().st_size
-            else:
-                results["missing_files"].append(filename)
-        
-        # Check required Markdown files
         required_md = self.validation_rules["output_files"]["required_markdown_files"]
-        for filename in required_md:
-            file_path = analysis_dir / filename
-            if file_path.exists():
-                results["required_files_present"].append(filename)
-                results["file_sizes"][filename] = file_path.stat().st_size
-            else:
+        for filename in required_json + required_md:
+            try:
+                file_size = (analysis_dir / filename).stat().st_size
+            except OSError:
                 results["missing_files"].append(filename)
+            else:
+                results["required_files_present"].append(filename)
+                results["file_sizes"][filename] = file_size
         
         # Check for pages directory
         pages_dir = analysis_dir / "pages"
-        if pages_dir.exists() and pages_dir.is_dir():
+        if pages_dir.is_dir():
             results["required_files_present"].append("pages/")
             page_files = list(pages_dir.glob("*.json"))
             results["file_sizes"]["pages/"] = len(page_files)
@@ -505,16 +506,32 @@ class AnalysisValidator:
         console.print(table)
 
 
+def stat_analysis_directory(analysis_dir: Path) -> os.stat_result:
+    """Stat an analysis directory once, failing like ``click.Path(exists=True)``."""
+    try:
+        st = analysis_dir.stat()
+    except OSError:
+        raise click.BadParameter(
+            f"Directory '{analysis_dir}' does not exist.", param_hint="'ANALYSIS_DIR'"
+        ) from None
+    if not stat.S_ISDIR(st.st_mode):
+        raise click.BadParameter(
+            f"Directory '{analysis_dir}' is a file.", param_hint="'ANALYSIS_DIR'"
+        )
+    return st
+
+
 @click.command()
-@click.argument("analysis_dir", type=click.Path(exists=True, path_type=Path))
+@click.argument("analysis_dir", type=click.Path(path_type=Path))
 @click.option("--detailed", "-d", is_flag=True, help="Show detailed validation results")
 @click.option("--output", "-o", type=click.Path(path_type=Path), help="Save validation report to file")
 def validate(analysis_dir: Path, detailed: bool, output: Optional[Path]):
     """Validate analysis output structure and completeness."""
+    analysis_stat = stat_analysis_directory(analysis_dir)
     validator = AnalysisValidator()
     
     try:
-        results = validator.validate_analysis_directory(analysis_dir)
+        results = validator.validate_analysis_directory(analysis_dir, analysis_stat)
         
         # Display results
         validator.display_validation_results(results)
@@ -2,13 +2,58 @@
 
 import click
 import json
+import sys
 from pathlib import Path
+from types import MappingProxyType, SimpleNamespace
 from typing import Optional
+from urllib.parse import urlparse
 
 from rich.console import Console
+from rich.panel import Panel
 from rich.progress import Progress, SpinnerColumn, TextColumn
-
-console = Console()
+from rich.table import Table
+from rich.text import Text
+from rich.tree import Tree
+
+# Highlighting and emoji-code substitution are not used by any command output,
+# so skip those regex passes on every print.
+console = Console(highlight=False, soft_wrap=True, markup=True, emoji=False, log_time=False)
+
+# Status prefixes parsed once; messages are appended as plain Text at print time
+_OK_PREFIX = Text.from_markup("[bold green]✓[/bold green] ")
+_FAIL_PREFIX = Text.from_markup("[bold red]✗[/bold red] ")
+
+# Default configuration written by `config init`
+DEFAULT_CONFIG = MappingProxyType({
+    "crawl_config": MappingProxyType({
+        "max_depth": 2,
+        "max_pages": 50,
+        "include_assets": True,
+        "respect_robots_txt": True,
+        "rate_limit_delay": 1.0,
+        "concurrent_requests": 5,
+        "browser_engine": "chromium",
+        "timeout": 30
+    }),
+    "metadata": MappingProxyType({
+        "analysis_philosophy": "modern_interpretation",
+        "target_framework": "react_nextjs",
+        "design_era": "2025_modern_web",
+        "accessibility_level": "wcag_aa",
+        "performance_targets": (
+            "core_web_vitals_optimized",
+        )
+    }),
+    "output_config": MappingProxyType({
+        "generate_markdown": True,
+        "download_assets": False,
+        "use_dynamic_crawler": True
+    })
+})
+
+_DEFAULT_CONFIG_JSON = json.dumps(
+    {section: dict(values) for section, values in DEFAULT_CONFIG.items()}, indent=2
+)
 
 
 @click.group()
@@ -54,6 +99,11 @@ def cli():
     default="chromium",
     help="Browser engine for dynamic content"
 )
+@click.option(
+    "--no-cache",
+    is_flag=True,
+    help="Re-analyze every page instead of reusing cached results"
+)
 def analyze(
     url: str,
     output: Path,
@@ -61,11 +111,12 @@ def analyze(
     max_pages: int,
     include_assets: bool,
     interactive: bool,
-    browser: str
+    browser: str,
+    no_cache: bool
 ):
     """Analyze a website and generate comprehensive specifications."""
-    console.print(f"[bold blue]Analyzing website:[/bold blue] {url}")
-    console.print(f"[dim]Output directory:[/dim] {output}")
+    console.print(Text.assemble(("Analyzing website:", "bold blue"), " ", url))
+    console.print(Text.assemble(("Output directory:", "dim"), " ", str(output)))
     console.print(f"[dim]Max depth:[/dim] {depth}, [dim]Max pages:[/dim] {max_pages}")
     
     if interactive:
@@ -92,34 +143,39 @@ def analyze(
                 },
                 "use_dynamic_crawler": True,
                 "generate_markdown": True,
-                "download_assets": include_assets
+                "download_assets": include_assets,
+                "use_cache": not no_cache
             }
             
             progress.update(task, description="Running analysis...")
             
-            # Run the analysis
+            # Run the analysis (on uvloop when the optional speedups are installed)
             import asyncio
+            from ..utils.performance import install_uvloop
+            install_uvloop()
             site = asyncio.run(analyze_website(url, config, output))
             
             progress.update(task, description="Analysis complete!")
     except Exception as e:
-        console.print(f"[bold red]✗[/bold red] Analysis failed: {str(e)}")
+        console.print(_FAIL_PREFIX + Text(f"Analysis failed: {e}"))
         raise click.Abort()
     
-    console.print("[bold green]✓[/bold green] Analysis completed successfully!")
-    console.print(f"[dim]Results saved to:[/dim] {output}")
+    console.print(_OK_PREFIX + Text("Analysis completed successfully!"))
+    console.print(Text.assemble(("Results saved to:", "dim"), " ", str(output)))
 
 
 
 
 @cli.command()
-@click.argument("analysis_dir", type=click.Path(exists=True, path_type=Path))
+@click.argument("analysis_dir", type=click.Path(path_type=Path))
 @click.option("--format", "-f", type=click.Choice(["console", "json", "markdown"]), default="console", help="Output format")
 @click.option("--output", "-o", type=click.Path(path_type=Path), help="Save summary to file")
 def summary(analysis_dir: Path, format: str, output: Optional[Path]):
     """Generate human-readable summary of analysis results."""
-    from rich.table import Table
-    from rich.panel import Panel
+    from .commands.validate import stat_analysis_directory
+    
+    # Only validates the argument; summary reads the files and needs no stat of its own
+    stat_analysis_directory(analysis_dir)
     
     try:
         # Load analysis data
@@ -127,21 +183,12 @@ def summary(analysis_dir: Path, format: str, output: Optional[Path]):
         summary_file = analysis_dir / "analysis_summary.json"
         validation_file = analysis_dir / "validation_report.json"
         
-        if not site_data_file.exists():
+        site_data = _read_json_file(site_data_file)
+        if site_data is None:
             raise click.ClickException(f"Analysis data not found: {site_data_file}")
         
-        with open(site_data_file, 'r', encoding='utf-8') as f:
-            site_data = json.load(f)
-        
-        summary_data = {}
-        if summary_file.exists():
-            with open(summary_file, 'r', encoding='utf-8') as f:
-                summary_data = json.load(f)
-        
-        validation_data = {}
-        if validation_file.exists():
-            with open(validation_file, 'r', encoding='utf-8') as f:
-                validation_data = json.load(f)
+        summary_data = _read_json_file(summary_file) or {}
+        validation_data = _read_json_file(validation_file) or {}
         
         if format == "console":
             _display_console_summary(site_data, summary_data, validation_data, analysis_dir)
@@ -156,11 +203,12 @@ def summary(analysis_dir: Path, format: str, output: Optional[Path]):
         elif format == "markdown":
             markdown_content = _generate_markdown_summary(site_data, summary_data, validation_data, analysis_dir)
             if output:
-                with open(output, 'w', encoding='utf-8') as f:
-                    f.write(markdown_content)
+                output.write_text(markdown_content, encoding='utf-8')
                 console.print(f"[green]Summary saved to: {output}[/green]")
             else:
-                console.print(markdown_content)
+                # Already formatted Markdown; bypass Rich's markup/render pipeline
+                sys.stdout.write(markdown_content + "\n")
+                sys.stdout.flush()
         
         console.print("\n[green]✓ Summary generated successfully![/green]")
         
@@ -185,68 +233,44 @@ def config():
 @click.option("--overwrite", is_flag=True, help="Overwrite existing config file")
 def config_init(output: Path, overwrite: bool):
     """Create a default configuration file."""
-    if output.exists() and not overwrite:
+    try:
+        # Exclusive-create mode reports an existing file without a separate stat
+        with open(output, 'w' if overwrite else 'x', encoding='utf-8') as f:
+            f.write(_DEFAULT_CONFIG_JSON)
+    except FileExistsError:
         console.print(f"[yellow]Config file already exists: {output}[/yellow]")
         console.print("[dim]Use --overwrite to replace it[/dim]")
         return
-    
-    # Create default configuration
-    default_config = {
-        "crawl_config": {
-            "max_depth": 2,
-            "max_pages": 50,
-            "include_assets": True,
-            "respect_robots_txt": True,
-            "rate_limit_delay": 1.0,
-            "concurrent_requests": 5,
-            "browser_engine": "chromium",
-            "timeout": 30
-        },
-        "metadata": {
-            "analysis_philosophy": "modern_interpretation",
-            "target_framework": "react_nextjs",
-            "design_era": "2025_modern_web",
-            "accessibility_level": "wcag_aa",
-            "performance_targets": [
-                "core_web_vitals_optimized"
-            ]
-        },
-        "output_config": {
-            "generate_markdown": True,
-            "download_assets": False,
-            "use_dynamic_crawler": True
-        }
-    }
-    
-    try:
-        with open(output, 'w', encoding='utf-8') as f:
-            json.dump(default_config, f, indent=2)
-        
-        console.print(f"[bold green]✓[/bold green] Configuration file created: {output}")
-        console.print("\n[dim]You can now customize the configuration and use it with:[/dim]")
-        console.print(f"[dim]  getsitedna analyze <url> --config {output}[/dim]")
-        
     except Exception as e:
         console.print(f"[red]Failed to create config file: {e}[/red]")
         raise click.ClickException(f"Config creation error: {e}")
+    
+    console.print(_OK_PREFIX + Text(f"Configuration file created: {output}"))
+    console.print("\n[dim]You can now customize the configuration and use it with:[/dim]")
+    console.print(f"[dim]  getsitedna analyze <url> --config {output}[/dim]")
+
+
+def _read_json_file(path: Path) -> Optional[dict]:
+    """Read and decode a JSON file in a single pass.
+    
+    Returns None when the file does not exist, so callers don't need a
+    separate exists() check before opening it.
+    """
+    try:
+        data = path.read_bytes()
+    except FileNotFoundError:
+        return None
+    return json.loads(data)
 
 
 def _display_console_summary(site_data: dict, summary_data: dict, validation_data: dict, analysis_dir: Path):
     """Display summary in console format."""
-    from rich.table import Table
-    from rich.panel import Panel
-    from rich.tree import Tree
-    
     # Site overview
     base_url = site_data.get("base_url", "Unknown")
     domain = site_data.get("domain", "Unknown")
     
-    console.print(Panel.fit(
-        f"[bold blue]{base_url}[/bold blue]\n"
-        f"Domain: {domain}",
-        title="🌐 Site Analysis Summary",
-        border_style="blue"
-    ))
+    overview = Text.assemble((str(base_url), "bold blue"), "\nDomain: ", str(domain))
+    console.print(Panel.fit(overview, title="🌐 Site Analysis Summary", border_style="blue"))
     
     # Statistics table
     stats = site_data.get("statistics", {})
@@ -280,22 +304,18 @@ def _display_console_summary(site_data: dict, summary_data: dict, validation_dat
 
 def _display_site_map(site_data: dict, analysis_dir: Path):
     """Display site map with intent mapping."""
-    from rich.tree import Tree
-    from rich.panel import Panel
-    
     # Load pages data to get the full site structure
     pages_data_file = analysis_dir / "pages_data.json"
-    if not pages_data_file.exists():
-        console.print("\n🗺️  [yellow]Site map unavailable - pages data not found[/yellow]")
-        return
-    
     try:
-        with open(pages_data_file, 'r', encoding='utf-8') as f:
-            pages_data = json.load(f)
+        pages_data = _read_json_file(pages_data_file)
     except Exception as e:
         console.print(f"\n🗺️  [yellow]Site map unavailable - error loading pages data: {e}[/yellow]")
         return
     
+    if pages_data is None:
+        console.print("\n🗺️  [yellow]Site map unavailable - pages data not found[/yellow]")
+        return
+    
     # Initialize intent detector
     from ..utils.intent_detection import IntentDetector
     detector = IntentDetector()
@@ -314,7 +334,6 @@ def _display_site_map(site_data: dict, analysis_dir: Path):
     
     for url, page_data in pages.items():
         # Create a simplified page object for intent detection
-        from types import SimpleNamespace
         page_mock = SimpleNamespace()
         page_mock.url = url
         page_mock.title = page_data.get("basic_info", {}).get("title", "")
@@ -360,7 +379,6 @@ def _display_site_map(site_data: dict, analysis_dir: Path):
         priority = intent_info.get("priority", "Low")
         
         # Format URL for display
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         display_path = parsed.path or "/"
         
@@ -455,16 +473,14 @@ def _generate_json_summary(site_data: dict, summary_data: dict, validation_data:
 
 def _generate_site_map_data(analysis_dir: Path) -> dict:
     """Generate site map data for JSON/Markdown output."""
-    pages_data_file = analysis_dir / "pages_data.json"
-    if not pages_data_file.exists():
-        return None
-    
     try:
-        with open(pages_data_file, 'r', encoding='utf-8') as f:
-            pages_data = json.load(f)
+        pages_data = _read_json_file(analysis_dir / "pages_data.json")
     except Exception:
         return None
     
+    if pages_data is None:
+        return None
+    
     # Initialize intent detector
     from ..utils.intent_detection import IntentDetector
     detector = IntentDetector()
@@ -480,7 +496,6 @@ def _generate_site_map_data(analysis_dir: Path) -> dict:
     # Analyze each page for intent
     for url, page_data in pages.items():
         # Create a simplified page object for intent detection
-        from types import SimpleNamespace
         page_mock = SimpleNamespace()
         page_mock.url = url
         page_mock.title = page_data.get("basic_info", {}).get("title", "")
@@ -568,7 +583,6 @@ def _generate_site_map_markdown(analysis_dir: Path) -> str:
         description = page.get("description", "")
         components = page.get("components_count", 0)
         
-        from urllib.parse import urlparse
         parsed = urlparse(url)
         display_path = parsed.path or "/"
         
@@ -1,15 +1,24 @@
 """Main analyzer orchestrating the entire analysis process."""
 
 import asyncio
+import hashlib
+import os
+import random
 import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Any, Callable, Dict, List, Optional, Tuple, Union
 
+from bs4 import BeautifulSoup
+from playwright.async_api import async_playwright, Browser, Playwright
+
+from .. import __version__
 from ..models.site import Site, CrawlConfig
 from ..models.page import Page
 from ..models.schemas import AnalysisMetadata
 from ..crawlers.static_crawler import StaticCrawler
-from ..crawlers.dynamic_crawler import DynamicCrawler
+from ..crawlers.dynamic_crawler import DynamicCrawler, launch_browser
 from ..extractors.content import ContentExtractor
 from ..extractors.structure import StructureExtractor
 from ..extractors.design import DesignExtractor
@@ -19,40 +28,99 @@ from ..processors.pattern_recognition import recognize_site_patterns
 from ..outputs.json_writer import JSONWriter
 from ..outputs.markdown_writer import MarkdownWriter
 from ..utils.error_handling import (
-    ErrorHandler, SafeExecutor, retry_on_error, RetryConfig,
+    ErrorHandler, SafeExecutor, RetryConfig,
     AnalysisError, ErrorSeverity, ErrorCategory
 )
 from ..utils.cache import file_cache
-from ..utils.performance import ConcurrentProcessor, performance_context, PerformanceMonitor
+from ..utils.performance import (
+    ConcurrentProcessor, performance_context, PerformanceMonitor, run_in_thread
+)
 
 
 class SiteAnalyzer:
     """Main orchestrator for complete website analysis."""
     
+    # BeautifulSoup tree builder used for page analysis (C-based lxml)
+    PARSER = "lxml"
+    
+    # Quality penalty per error, by severity
+    _SEVERITY_PENALTIES = (
+        ("critical", 0.3),  # Critical errors are heavily penalized
+        ("high", 0.1),      # High errors moderately penalized
+    )
+    
+    # Recommendation per error category, given once its count exceeds the threshold
+    _CATEGORY_RECOMMENDATIONS = (
+        ("network", 5,
+         "Multiple network errors detected. Consider increasing timeout values or checking network connectivity."),
+        ("browser", 3,
+         "Browser automation issues detected. Try using static crawler for this site."),
+        ("parsing", 10,
+         "Many parsing errors detected. The site may have malformed HTML or use complex JavaScript rendering."),
+    )
+    
+    # Progress is logged roughly this many times over a run
+    PROGRESS_LOG_STEPS = 100
+    
+    # Seconds to wait for a browser or the Playwright driver to shut down
+    BROWSER_CLOSE_TIMEOUT = 10.0
+    
     def __init__(self, 
                  output_directory: Optional[Path] = None,
                  use_dynamic_crawler: bool = True,
                  generate_markdown: bool = True,
-                 download_assets: bool = False):
+                 download_assets: bool = False,
+                 use_process_pool: bool = False,
+                 use_cache: bool = True,
+                 monitor_sample_rate: float = 0.0):
         self.output_directory = output_directory
         self.use_dynamic_crawler = use_dynamic_crawler
         self.generate_markdown = generate_markdown
         self.download_assets = download_assets
+        self.use_process_pool = use_process_pool
+        self.use_cache = use_cache
+        self.monitor_sample_rate = monitor_sample_rate
         
         # Error handling
         self.error_handler = ErrorHandler("getsitedna.analyzer")
         self.safe_executor = SafeExecutor(self.error_handler)
         
         # Analysis modules
-        self.content_extractor = ContentExtractor()
-        self.structure_extractor = StructureExtractor()
-        self.design_extractor = DesignExtractor()
+        self.content_extractor = ContentExtractor(parser=self.PARSER)
+        self.structure_extractor = StructureExtractor(parser=self.PARSER)
+        self.design_extractor = DesignExtractor(parser=self.PARSER)
+        
+        # Cached analyses are only reused by the same release, parser and extractors
+        self._analysis_cache_scope = ":".join((
+            __version__,
+            self.PARSER,
+            *(type(extractor).__name__ for extractor in (
+                self.design_extractor, self.content_extractor, self.structure_extractor
+            )),
+        ))
         
         # Performance optimization
         self.processor = ConcurrentProcessor(max_workers=4)
         self.performance_monitor = PerformanceMonitor()
         
-        # Retry configuration
+        # HTML parsing is CPU-bound; optionally spread it across processes.
+        # The pool is created on first use and released by aclose().
+        self._cpu_pool: Optional[ProcessPoolExecutor] = None
+        
+        # Pages analyzed while the crawl was still running
+        self._pages_streamed = 0
+        
+        # Last analysis summary, with the error count it was built from
+        self._summary_cache: Optional[Tuple[int, Dict[str, Any]]] = None
+        
+        # Browsers kept open across analyze_site calls, per engine; released by aclose(),
+        # or at the end of each analyze_site call when not used with ``async with``
+        self._playwright: Optional[Playwright] = None
+        self._browsers: Dict[str, Browser] = {}
+        self._browser_loop: Optional[asyncio.AbstractEventLoop] = None
+        self._in_context = False
+        
+        # Per-page retry configuration for crawler navigation
         self.retry_config = RetryConfig(
             max_attempts=3,
             base_delay=2.0,
@@ -64,63 +132,125 @@ class SiteAnalyzer:
                           config: Optional[CrawlConfig] = None,
                           metadata: Optional[AnalysisMetadata] = None) -> Site:
         """Perform complete site analysis with performance optimization."""
-        async with performance_context(enable_monitoring=True) as ctx:
-            start_time = time.time()
-            
-            try:
-                # Initialize site
-                site = self._initialize_site(url, config, metadata)
-                
-                self.error_handler.logger.info(f"Starting analysis of {url}")
-                
-                # Phase 1: Crawling
-                site = await self._crawl_site(site)
-                
-                # Phase 2: Parallel Content and Design Analysis
-                site = await self._analyze_content_and_design_parallel(site)
-                
-                # Phase 4: Pattern Recognition
-                site = await self._recognize_patterns(site)
-                
-                # Phase 5: Asset Processing
-                if self.download_assets:
-                    site = await self._process_assets(site)
-                
-                # Phase 6: API Discovery
-                site = await self._discover_apis(site)
-                
-                # Finalize analysis (update statistics before output generation)
-                site.mark_analysis_complete()
-                
-                # Calculate validation scores
-                self._calculate_validation_scores(site)
-                
-                # Phase 7: Generate Outputs
-                await self._generate_outputs(site)
-                
-                analysis_time = time.time() - start_time
-                self.error_handler.logger.info(
-                    f"Analysis completed in {analysis_time:.2f}s. "
-                    f"Pages: {site.stats.total_pages_analyzed}, "
-                    f"Errors: {self.error_handler.error_stats['total_errors']}"
-                )
+        try:
+            async with performance_context(enable_monitoring=self._monitor_this_run()) as ctx:
+                start_time = time.time()
+                site: Optional[Site] = None
                 
-                return site
+                try:
+                    # Initialize site
+                    site = self._initialize_site(url, config, metadata)
+                    
+                    self.error_handler.logger.info("Starting analysis of %s", url)
+                    
+                    # Phases 1-3: Crawling, with content and design analysis
+                    # running on pages as soon as the crawler finishes them
+                    site = await self._crawl_and_analyze(site)
+                    
+                    # Phases 4-6: Pattern Recognition, API Discovery and Asset Processing.
+                    # Each phase updates a separate part of the site, so run them concurrently.
+                    phases = [self._recognize_patterns(site), self._discover_apis(site)]
+                    if self.download_assets:
+                        phases.append(self._process_assets(site))
+                    
+                    for result in await asyncio.gather(*phases, return_exceptions=True):
+                        if isinstance(result, Exception):
+                            site.add_warning(f"Analysis phase failed: {result}")
+                            self.error_handler.handle_error(result, {"phase": "concurrent_phases"})
+                    
+                    # Finalize analysis (update statistics before output generation)
+                    site.mark_analysis_complete()
+                    
+                    # Calculate validation scores
+                    self._calculate_validation_scores(site)
+                    
+                    # Phase 7: Generate Outputs
+                    await self._generate_outputs(site)
+                    
+                    analysis_time = time.time() - start_time
+                    self.error_handler.logger.info(
+                        "Analysis completed in %.2fs. Pages: %d, Errors: %d",
+                        analysis_time,
+                        site.stats.total_pages_analyzed,
+                        self.error_handler.total_errors
+                    )
+                    
+                    return site
                 
+                except Exception as e:
+                    analysis_error = self.error_handler.handle_error(
+                        e, {"url": url, "phase": "unknown"}
+                    )
+                    
+                    if analysis_error.severity == ErrorSeverity.CRITICAL:
+                        raise analysis_error
+                    
+                    # Return partial results if possible
+                    if site is not None:
+                        site.add_error(f"Analysis incomplete due to error: {analysis_error.message}")
+                        return site
+                    else:
+                        raise analysis_error
+        finally:
+            # Without ``async with`` nothing else would close the browser this run launched
+            if not self._in_context:
+                await self._close_browsers()
+    
+    def _monitor_this_run(self) -> bool:
+        """Decide whether this run is sampled for performance monitoring."""
+        return self.monitor_sample_rate > 0 and random.random() < self.monitor_sample_rate
+    
+    async def __aenter__(self) -> "SiteAnalyzer":
+        self._in_context = True
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        self._in_context = False
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the browsers and process pool kept open between analyses."""
+        if self._cpu_pool is not None:
+            # Waiting for the workers blocks, so keep it off the event loop
+            pool, self._cpu_pool = self._cpu_pool, None
+            await run_in_thread(pool.shutdown)
+        
+        await self._close_browsers()
+    
+    async def _close_browsers(self) -> None:
+        """Close the shared browsers, then stop the Playwright driver."""
+        browsers = list(self._browsers.values())
+        self._browsers.clear()
+        playwright, self._playwright = self._playwright, None
+        
+        closers = [browser.close() for browser in browsers]
+        if playwright is not None:
+            closers.append(playwright.stop())
+        
+        for closer in closers:
+            try:
+                await asyncio.wait_for(closer, self.BROWSER_CLOSE_TIMEOUT)
             except Exception as e:
-                analysis_error = self.error_handler.handle_error(
-                    e, {"url": url, "phase": "unknown"}
-                )
-                
-                if analysis_error.severity == ErrorSeverity.CRITICAL:
-                    raise analysis_error
-                
-                # Return partial results if possible
-                if 'site' in locals():
-                    site.add_error(f"Analysis incomplete due to error: {analysis_error.message}")
-                    return site
-                else:
-                    raise analysis_error
+                # Already gone, or bound to a loop that has finished
+                self.error_handler.logger.debug("Closing browser failed: %s", e)
+    
+    async def _get_browser(self, browser_engine: str) -> Browser:
+        """Return the shared browser for an engine, launching it on first use."""
+        loop = asyncio.get_running_loop()
+        if self._browser_loop is not loop:
+            # Playwright objects are bound to the loop that created them, so
+            # shut down the previous loop's before starting over
+            await self._close_browsers()
+            self._browser_loop = loop
+        
+        browser = self._browsers.get(browser_engine)
+        if browser is None or not browser.is_connected():
+            if self._playwright is None:
+                self._playwright = await async_playwright().start()
+            browser = await launch_browser(self._playwright, browser_engine)
+            self._browsers[browser_engine] = browser
+        
+        return browser
     
     def _initialize_site(self, 
                         url: str, 
@@ -140,31 +270,50 @@ class SiteAnalyzer:
         
         return site
     
-    @retry_on_error(exceptions=(AnalysisError,))
-    async def _crawl_site(self, site: Site) -> Site:
+    async def _crawl_site(self,
+                          site: Site,
+                          on_page_crawled: Optional[Callable[[Page], None]] = None) -> Site:
         """Crawl the website to discover and analyze pages."""
         self.error_handler.logger.info("Phase 1: Crawling website")
         
         try:
             if self.use_dynamic_crawler:
-                # Use dynamic crawler for JavaScript-heavy sites
-                crawler = DynamicCrawler(site)
+                # Use dynamic crawler for JavaScript-heavy sites, reusing the
+                # analyzer's browser (the crawler launches its own if that fails)
+                browser = await self.safe_executor.safe_execute(
+                    self._get_browser,
+                    site.config.browser_engine,
+                    error_context={"phase": "browser_launch", "url": str(site.base_url)}
+                )
+                crawler = DynamicCrawler(
+                    site,
+                    on_page_crawled=on_page_crawled,
+                    retry_config=self.retry_config,
+                    browser=browser
+                )
                 site = await self.safe_executor.safe_execute(
                     crawler.crawl_site,
                     error_context={"phase": "dynamic_crawling", "url": str(site.base_url)},
                     default_return=site
                 )
             else:
-                # Use static crawler for traditional sites
-                crawler = StaticCrawler(site)
+                # Use static crawler for traditional sites, parsing pages in
+                # the process pool when enabled
+                crawler = StaticCrawler(
+                    site,
+                    on_page_crawled=on_page_crawled,
+                    cpu_pool=self._get_cpu_pool() if self.use_process_pool else None,
+                    use_cache=self.use_cache
+                )
                 site = await self.safe_executor.safe_execute(
                     crawler.crawl_site,
                     error_context={"phase": "static_crawling", "url": str(site.base_url)},
                     default_return=site
                 )
             
+            crawled_count = sum(1 for page in site.pages.values() if page.is_successful)
             self.error_handler.logger.info(
-                f"Crawling completed: {len(site.crawled_pages)} pages successfully crawled"
+                "Crawling completed: %d pages successfully crawled", crawled_count
             )
             
             return site
@@ -177,41 +326,87 @@ class SiteAnalyzer:
                 {"url": str(site.base_url)}
             )
     
+    async def _crawl_and_analyze(self, site: Site) -> Site:
+        """Crawl the site while workers analyze pages streamed from the crawler."""
+        queue: asyncio.Queue = asyncio.Queue()
+        self._pages_streamed = 0
+        workers = [
+            asyncio.ensure_future(self._analysis_worker(queue, site))
+            for _ in range(self.processor.max_workers)
+        ]
+        
+        try:
+            site = await self._crawl_site(site, on_page_crawled=queue.put_nowait)
+        finally:
+            # One sentinel per worker; workers drain the queue before stopping
+            for _ in workers:
+                queue.put_nowait(None)
+            await asyncio.gather(*workers)
+        
+        # Pick up any pages that were not streamed, then analyze the global design system
+        return await self._analyze_content_and_design_parallel(site)
+    
+    async def _analysis_worker(self, queue: asyncio.Queue, site: Site) -> None:
+        """Analyze crawled pages from the queue until a None sentinel arrives."""
+        while True:
+            page = await queue.get()
+            if page is None:
+                break
+            
+            url_str = page.url_str
+            site.pages[url_str] = await self._analyze_page(page, url_str)
+            self._pages_streamed += 1
+            if self._pages_streamed % self._progress_interval(site.config.max_pages) == 0:
+                self.error_handler.logger.info(
+                    "Analysis progress: %d pages completed during crawl", self._pages_streamed
+                )
+    
+    def _progress_interval(self, total: int) -> int:
+        """Number of completed pages between progress log lines."""
+        return max(1, total // self.PROGRESS_LOG_STEPS)
+    
     async def _analyze_content(self, site: Site) -> Site:
         """Analyze content and structure of all crawled pages."""
         self.error_handler.logger.info("Phase 2: Analyzing content and structure")
         
-        successful_analyses = 0
-        
-        for page in site.crawled_pages:
-            try:
-                # Content extraction
-                page = await self.safe_executor.safe_execute(
-                    self.content_extractor.extract_content,
-                    page,
-                    error_context={"phase": "content_extraction", "url": str(page.url)},
-                    default_return=page
-                )
-                
-                # Structure extraction
-                page = await self.safe_executor.safe_execute(
-                    self.structure_extractor.extract_structure,
-                    page,
-                    error_context={"phase": "structure_extraction", "url": str(page.url)},
-                    default_return=page
-                )
-                
-                page.mark_analyzed()
-                successful_analyses += 1
-                
-            except Exception as e:
-                page.add_error(f"Content analysis failed: {e}")
-                self.error_handler.handle_error(
-                    e, {"phase": "content_analysis", "url": str(page.url)}
-                )
+        crawled_pages = site.crawled_pages
+        semaphore = asyncio.Semaphore(self.processor.max_workers)
+        
+        async def analyze_page_content(page: Page) -> bool:
+            url_str = page.url_str
+            async with semaphore:
+                try:
+                    # Content extraction
+                    page = await self.safe_executor.safe_execute(
+                        self.content_extractor.extract_content,
+                        page,
+                        error_context={"phase": "content_extraction", "url": url_str},
+                        default_return=page
+                    )
+                    
+                    # Structure extraction
+                    page = await self.safe_executor.safe_execute(
+                        self.structure_extractor.extract_structure,
+                        page,
+                        error_context={"phase": "structure_extraction", "url": url_str},
+                        default_return=page
+                    )
+                    
+                    page.mark_analyzed()
+                    return True
+                    
+                except Exception as e:
+                    page.add_error(f"Content analysis failed: {e}")
+                    self.error_handler.handle_error(
+                        e, {"phase": "content_analysis", "url": url_str}
+                    )
+                    return False
+        
+        results = await asyncio.gather(*(analyze_page_content(page) for page in crawled_pages))
+        successful_analyses = sum(results)
         
         self.error_handler.logger.info(
-            f"Content analysis completed: {successful_analyses}/{len(site.crawled_pages)} pages"
+            "Content analysis completed: %d/%d pages", successful_analyses, len(crawled_pages)
         )
         
         return site
@@ -220,20 +415,26 @@ class SiteAnalyzer:
         """Analyze design elements across all pages."""
         self.error_handler.logger.info("Phase 3: Analyzing design elements")
         
-        for page in site.crawled_pages:
-            try:
-                page = await self.safe_executor.safe_execute(
-                    self.design_extractor.extract_design,
-                    page,
-                    error_context={"phase": "design_extraction", "url": str(page.url)},
-                    default_return=page
-                )
-                
-            except Exception as e:
-                page.add_warning(f"Design analysis failed: {e}")
-                self.error_handler.handle_error(
-                    e, {"phase": "design_analysis", "url": str(page.url)}
-                )
+        semaphore = asyncio.Semaphore(self.processor.max_workers)
+        
+        async def analyze_page_design(page: Page) -> None:
+            url_str = page.url_str
+            async with semaphore:
+                try:
+                    await self.safe_executor.safe_execute(
+                        self.design_extractor.extract_design,
+                        page,
+                        error_context={"phase": "design_extraction", "url": url_str},
+                        default_return=page
+                    )
+                    
+                except Exception as e:
+                    page.add_warning(f"Design analysis failed: {e}")
+                    self.error_handler.handle_error(
+                        e, {"phase": "design_analysis", "url": url_str}
+                    )
+        
+        await asyncio.gather(*(analyze_page_design(page) for page in site.crawled_pages))
         
         # Analyze global design system
         try:
@@ -254,6 +455,7 @@ class SiteAnalyzer:
         
         try:
             site = await self.safe_executor.safe_execute(
+                run_in_thread,
                 recognize_site_patterns,
                 site,
                 error_context={"phase": "pattern_recognition"},
@@ -261,7 +463,7 @@ class SiteAnalyzer:
             )
             
             self.error_handler.logger.info(
-                f"Pattern recognition completed: {len(site.experience_patterns)} patterns identified"
+                "Pattern recognition completed: %d patterns identified", len(site.experience_patterns)
             )
             
         except Exception as e:
@@ -275,21 +477,28 @@ class SiteAnalyzer:
         self.error_handler.logger.info("Phase 5: Processing assets")
         
         asset_extractor = AssetExtractor(site, download_assets=True)
-        
-        for page in site.crawled_pages:
-            try:
-                page = await self.safe_executor.safe_execute(
-                    asset_extractor.extract_assets,
-                    page,
-                    error_context={"phase": "asset_processing", "url": str(page.url)},
-                    default_return=page
-                )
-                
-            except Exception as e:
-                page.add_warning(f"Asset processing failed: {e}")
-                self.error_handler.handle_error(
-                    e, {"phase": "asset_processing", "url": str(page.url)}
-                )
+        semaphore = asyncio.Semaphore(self.processor.max_workers)
+        
+        async def process_page_assets(page: Page) -> None:
+            url_str = page.url_str
+            async with semaphore:
+                try:
+                    await self.safe_executor.safe_execute(
+                        asset_extractor.extract_assets,
+                        page,
+                        error_context={"phase": "asset_processing", "url": url_str},
+                        default_return=page
+                    )
+                    
+                except Exception as e:
+                    page.add_warning(f"Asset processing failed: {e}")
+                    self.error_handler.handle_error(
+                        e, {"phase": "asset_processing", "url": url_str}
+                    )
+        
+        await asyncio.gather(*(
+            process_page_assets(page) for page in site.pages.values() if page.is_successful
+        ))
         
         return site
     
@@ -299,14 +508,16 @@ class SiteAnalyzer:
         
         try:
             site = await self.safe_executor.safe_execute(
+                run_in_thread,
                 discover_site_apis,
                 site,
+                self.PARSER,
                 error_context={"phase": "api_discovery"},
                 default_return=site
             )
             
             api_count = len(site.technical_modernization.api_endpoints or [])
-            self.error_handler.logger.info(f"API discovery completed: {api_count} endpoints found")
+            self.error_handler.logger.info("API discovery completed: %d endpoints found", api_count)
             
         except Exception as e:
             site.add_warning(f"API discovery failed: {e}")
@@ -323,75 +534,74 @@ class SiteAnalyzer:
         if not site.output_directory:
             site.output_directory = Path("./analysis")
         
+        # JSON and Markdown writers do blocking file I/O; run them side by side in threads
+        output_directory = site.output_directory
+        writers = [run_in_thread(lambda: JSONWriter(output_directory).write_site_analysis(site))]
+        if self.generate_markdown:
+            writers.append(
+                run_in_thread(lambda: MarkdownWriter(output_directory).write_documentation(site))
+            )
+        
+        json_result, *markdown_result = await asyncio.gather(*writers, return_exceptions=True)
+        
         # Generate JSON outputs
-        try:
-            json_writer = JSONWriter(site.output_directory)
-            json_files = json_writer.write_site_analysis(site)
-            output_files.update(json_files)
-            
-        except Exception as e:
-            site.add_error(f"JSON output generation failed: {e}")
-            self.error_handler.handle_error(e, {"phase": "json_output"})
+        if isinstance(json_result, Exception):
+            site.add_error(f"JSON output generation failed: {json_result}")
+            self.error_handler.handle_error(json_result, {"phase": "json_output"})
+        else:
+            output_files.update(json_result)
         
         # Generate Markdown documentation
-        if self.generate_markdown:
-            try:
-                markdown_writer = MarkdownWriter(site.output_directory)
-                markdown_files = markdown_writer.write_documentation(site)
-                output_files.update(markdown_files)
-                
-            except Exception as e:
-                site.add_warning(f"Markdown output generation failed: {e}")
-                self.error_handler.handle_error(e, {"phase": "markdown_output"})
+        for result in markdown_result:
+            if isinstance(result, Exception):
+                site.add_warning(f"Markdown output generation failed: {result}")
+                self.error_handler.handle_error(result, {"phase": "markdown_output"})
+            else:
+                output_files.update(result)
         
-        self.error_handler.logger.info(f"Output generation completed: {len(output_files)} files created")
+        self.error_handler.logger.info("Output generation completed: %d files created", len(output_files))
         
         return output_files
     
     def get_analysis_summary(self) -> Dict[str, Any]:
         """Get summary of the analysis process."""
-        error_stats = self.error_handler.get_error_summary()
+        # The error count only grows, so it tells us when the cached summary is stale
+        total_errors = self.error_handler.total_errors
+        if self._summary_cache is not None and self._summary_cache[0] == total_errors:
+            return self._summary_cache[1]
         
-        return {
+        error_stats = self.error_handler.get_error_summary()
+        summary = {
             "error_statistics": error_stats,
             "analysis_quality": self._calculate_analysis_quality(error_stats),
             "recommendations": self._generate_analysis_recommendations(error_stats)
         }
+        self._summary_cache = (total_errors, summary)
+        
+        return summary
     
     def _calculate_analysis_quality(self, error_stats: Dict) -> float:
         """Calculate overall analysis quality score."""
-        total_errors = error_stats["total_errors"]
-        critical_errors = error_stats["by_severity"].get("critical", 0)
-        high_errors = error_stats["by_severity"].get("high", 0)
-        
-        # Start with perfect score
-        quality = 1.0
+        by_severity = error_stats["by_severity"]
         
-        # Deduct for errors
-        quality -= critical_errors * 0.3  # Critical errors are heavily penalized
-        quality -= high_errors * 0.1      # High errors moderately penalized
-        quality -= total_errors * 0.01    # Small penalty for any error
+        # Start with perfect score, deduct per error by severity,
+        # plus a small penalty for any error
+        quality = 1.0 - sum(
+            by_severity.get(severity, 0) * penalty
+            for severity, penalty in self._SEVERITY_PENALTIES
+        )
+        quality -= error_stats["total_errors"] * 0.01
         
         return max(quality, 0.0)
     
     def _generate_analysis_recommendations(self, error_stats: Dict) -> List[str]:
         """Generate recommendations based on analysis errors."""
-        recommendations = []
-        
-        if error_stats["by_category"].get("network", 0) > 5:
-            recommendations.append(
-                "Multiple network errors detected. Consider increasing timeout values or checking network connectivity."
-            )
-        
-        if error_stats["by_category"].get("browser", 0) > 3:
-            recommendations.append(
-                "Browser automation issues detected. Try using static crawler for this site."
-            )
-        
-        if error_stats["by_category"].get("parsing", 0) > 10:
-            recommendations.append(
-                "Many parsing errors detected. The site may have malformed HTML or use complex JavaScript rendering."
-            )
+        by_category = error_stats["by_category"]
+        recommendations = [
+            message
+            for category, threshold, message in self._CATEGORY_RECOMMENDATIONS
+            if by_category.get(category, 0) > threshold
+        ]
         
         if error_stats["total_errors"] > 50:
             recommendations.append(
@@ -400,66 +610,142 @@ class SiteAnalyzer:
         
         return recommendations
     
+    def _analysis_cache_key(self, page: Page, url_str: str) -> Optional[str]:
+        """Build a cache key from the analysis scope, the page URL and a hash of its HTML."""
+        if not page.html_content:
+            return None
+        
+        html_hash = hashlib.sha256(page.html_content.encode("utf-8", "replace")).hexdigest()
+        return f"page_analysis:{self._analysis_cache_scope}:{url_str}:{html_hash}"
+    
+    @staticmethod
+    def _snapshot_page_analysis(page: Page, warnings: List[str]) -> Dict[str, Any]:
+        """Collect the page fields written by the content, design and structure extractors."""
+        return {
+            "content": page.content,
+            "design": page.design,
+            "structure": page.structure,
+            "forms": page.technical.forms,
+            "schema_markup": page.seo.schema_markup,
+            "warnings": warnings,
+        }
+    
+    @staticmethod
+    def _restore_page_analysis(page: Page, snapshot: Dict[str, Any]) -> None:
+        """Apply a cached extractor snapshot to a page."""
+        page.content = snapshot["content"]
+        page.design = snapshot["design"]
+        page.structure = snapshot["structure"]
+        page.technical.forms = snapshot["forms"]
+        page.seo.schema_markup = snapshot["schema_markup"]
+        for warning in snapshot["warnings"]:
+            page.add_warning(warning)
+    
+    async def _extract_all(self,
+                           page: Page,
+                           soup: Optional[BeautifulSoup] = None) -> Tuple[Page, List[Tuple[str, Exception]]]:
+        """Run design, content and structure extraction as one off-loop task.
+        
+        Uses the process pool when enabled; the shared soup is only used in-process,
+        pool workers parse their own copy.
+        """
+        # Design runs first because content extraction strips <style> and <script> from the tree
+        extractors = (
+            ("design_analysis", self.design_extractor.extract_design),
+            ("content_analysis", self.content_extractor.extract_content),
+            ("structure_analysis", self.structure_extractor.extract_structure),
+        )
+        
+        if not self.use_process_pool:
+            return await run_in_thread(_run_extractors, extractors, page, soup)
+        
+        # The worker returns a processed copy of the page
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._get_cpu_pool(), _run_extractors, extractors, page)
+    
+    def _get_cpu_pool(self) -> ProcessPoolExecutor:
+        """Return the shared process pool, creating it on first use."""
+        if self._cpu_pool is None:
+            self._cpu_pool = ProcessPoolExecutor(max_workers=os.cpu_count())
+        return self._cpu_pool
+    
+    async def _analyze_page(self, page: Page, url_str: str) -> Page:
+        """Run content, design and structure analysis for a single page."""
+        try:
+            # Reuse results from an earlier run on identical HTML
+            cache_key = self._analysis_cache_key(page, url_str) if self.use_cache else None
+            if cache_key:
+                cached = await file_cache.get(cache_key)
+                if cached is not None:
+                    self._restore_page_analysis(page, cached)
+                    page.mark_analyzed()
+                    return page
+            
+            # Parse once and share the tree between extractors
+            soup = None
+            if page.html_content and not self.use_process_pool:
+                soup = BeautifulSoup(page.html_content, self.PARSER)
+            
+            # Design, content and structure analysis
+            warning_count = len(page.warnings)
+            page, failures = await self._extract_all(page, soup)
+            for phase, error in failures:
+                self.error_handler.handle_error(error, {"phase": phase, "url": url_str})
+            complete = not failures
+            
+            # Only cache fully successful analyses
+            if cache_key and complete:
+                await file_cache.set(
+                    cache_key, self._snapshot_page_analysis(page, page.warnings[warning_count:])
+                )
+            
+            # Mark page as analyzed (THIS WAS MISSING!)
+            page.mark_analyzed()
+            
+            return page
+        
+        except Exception as e:
+            page.add_warning(f"Analysis failed: {e}")
+            self.error_handler.handle_error(
+                e, {"phase": "parallel_analysis", "url": url_str}
+            )
+            return page
+    
     async def _analyze_content_and_design_parallel(self, site: Site) -> Site:
         """Analyze content and design in parallel for better performance."""
         self.error_handler.logger.info("Phase 2-3: Parallel content and design analysis")
         
-        # Process pages in batches for content and design analysis
-        pages_to_analyze = list(site.crawled_pages)
+        # Bound concurrency with a semaphore rather than fixed-size batches
+        semaphore = asyncio.Semaphore(self.processor.max_workers)
+        
+        async def analyze_with_semaphore(page: Page, url_str: str) -> Tuple[str, Page]:
+            async with semaphore:
+                return url_str, await self._analyze_page(page, url_str)
+        
+        # Fan out over crawled pages not yet analyzed, keyed by their existing URL strings,
+        # and report progress as each one finishes
+        tasks = [
+            asyncio.ensure_future(analyze_with_semaphore(page, url_str))
+            for url_str, page in site.pages.items()
+            if page.is_successful and page.analyzed_at is None
+        ]
+        processed_pages = []
+        log_interval = self._progress_interval(len(tasks))
         
-        async def analyze_page_content_and_design(page: Page) -> Page:
-            """Analyze both content and design for a single page."""
+        for completed, task in enumerate(asyncio.as_completed(tasks), 1):
             try:
-                # Content analysis
-                page = await self.safe_executor.safe_execute(
-                    self.content_extractor.extract_content,
-                    page,
-                    error_context={"phase": "content_analysis", "url": str(page.url)},
-                    default_return=page
-                )
-                
-                # Design analysis
-                page = await self.safe_executor.safe_execute(
-                    self.design_extractor.extract_design,
-                    page,
-                    error_context={"phase": "design_analysis", "url": str(page.url)},
-                    default_return=page
-                )
-                
-                # Structure analysis
-                page = await self.safe_executor.safe_execute(
-                    self.structure_extractor.extract_structure,
-                    page,
-                    error_context={"phase": "structure_analysis", "url": str(page.url)},
-                    default_return=page
-                )
-                
-                # Mark page as analyzed (THIS WAS MISSING!)
-                page.mark_analyzed()
-                
-                return page
-                
+                processed_pages.append(await task)
             except Exception as e:
-                page.add_warning(f"Analysis failed: {e}")
-                self.error_handler.handle_error(
-                    e, {"phase": "parallel_analysis", "url": str(page.url)}
+                self.error_handler.handle_error(e, {"phase": "parallel_analysis"})
+                continue
+            
+            if completed % log_interval == 0 or completed == len(tasks):
+                self.error_handler.logger.info(
+                    "Analysis progress: %d/%d pages completed", completed, len(tasks)
                 )
-                return page
-        
-        # Process pages concurrently
-        processed_pages = await self.processor.process_batch(
-            pages_to_analyze,
-            analyze_page_content_and_design,
-            batch_size=3,  # Smaller batches for memory efficiency
-            progress_callback=lambda completed, total: self.error_handler.logger.info(
-                f"Analysis progress: {completed}/{total} pages completed"
-            )
-        )
         
         # Update site with processed pages
-        for page in processed_pages:
-            if page:  # Check for None results from failed processing
-                site.pages[str(page.url)] = page
+        site.pages.update(processed_pages)
         
         # Global design system analysis
         site = await self.safe_executor.safe_execute(
@@ -470,47 +756,41 @@ class SiteAnalyzer:
         )
         
         self.error_handler.logger.info(
-            f"Parallel analysis completed: {len(processed_pages)} pages analyzed"
+            "Parallel analysis completed: %d pages analyzed", len(processed_pages)
         )
         
         return site
 
     def _calculate_validation_scores(self, site: Site) -> None:
         """Calculate validation scores for the site and pages."""
-        # Calculate page validation scores
-        for page in site.pages.values():
-            if page.is_successful and page.analyzed_at:
-                page.validation.completeness_score = self._calculate_page_completeness(page)
-                page.validation.quality_metrics = self._calculate_page_quality_metrics(page)
+        # Score analysed pages, accumulating the site average in the same pass.
+        # Skip the walk entirely when nothing was analysed (e.g. a rate-limited crawl).
+        total_score = 0.0
+        scored_pages = 0
+        if site.stats.total_pages_analyzed:
+            for page in site.pages.values():
+                if page.is_successful and page.analyzed_at:
+                    score = self._calculate_page_completeness(page)
+                    page.validation.completeness_score = score
+                    page.validation.quality_metrics = self._calculate_page_quality_metrics(page)
+                    total_score += score
+                    scored_pages += 1
         
         # Calculate site validation score
         if site.pages:
-            page_scores = [p.validation.completeness_score for p in site.pages.values() 
-                          if p.is_successful and p.analyzed_at]
-            site.validation.completeness_score = sum(page_scores) / len(page_scores) if page_scores else 0.0
+            site.validation.completeness_score = total_score / scored_pages if scored_pages else 0.0
             site.validation.quality_metrics = self._calculate_site_quality_metrics(site)
     
     def _calculate_page_completeness(self, page: Page) -> float:
         """Calculate completeness score for a single page."""
-        score = 0.0
-        
-        # Content analysis (25%)
-        if page.content.text_content:
-            score += 0.25
-        
-        # Structure analysis (25%)
-        if page.structure.components:
-            score += 0.25
-        
-        # Design analysis (25%)
-        if page.design.color_palette or page.design.typography:
-            score += 0.25
-        
-        # SEO completeness (25%)
-        if page.seo.title and page.seo.description:
-            score += 0.25
-        
-        return score
+        # Content, structure, design and SEO analysis each contribute 25%
+        sections_present = (
+            bool(page.content.text_content)
+            + bool(page.structure.components)
+            + bool(page.design.color_palette or page.design.typography)
+            + bool(page.seo.title and page.seo.description)
+        )
+        return sections_present * 0.25
     
     def _calculate_page_quality_metrics(self, page: Page) -> Dict[str, float]:
         """Calculate quality metrics for a page."""
@@ -536,18 +816,62 @@ class SiteAnalyzer:
         }
 
 
+def _run_extractors(extractors: Tuple[Tuple[str, Callable[..., Page]], ...],
+                    page: Page,
+                    soup: Optional[BeautifulSoup] = None) -> Tuple[Page, List[Tuple[str, Exception]]]:
+    """Apply each extractor to the page, collecting failures instead of raising.
+    
+    Module-level so it can be submitted to a process pool.
+    """
+    failures = []
+    for phase, extract in extractors:
+        try:
+            page = extract(page, soup=soup)
+        except Exception as e:
+            failures.append((phase, e))
+    return page, failures
+
+
+@dataclass(frozen=True)
+class AnalyzeOptions:
+    """Options for analyze_website."""
+    use_dynamic_crawler: bool = True
+    generate_markdown: bool = True
+    download_assets: bool = False
+    use_process_pool: bool = False
+    use_cache: bool = True
+    monitor_sample_rate: float = 0.0
+    
+    # Keyword arguments for CrawlConfig and AnalysisMetadata
+    crawl_config: Optional[Dict[str, Any]] = None
+    metadata: Optional[Dict[str, Any]] = None
+    
+    @classmethod
+    def from_dict(cls, config: Dict[str, Any]) -> "AnalyzeOptions":
+        """Build options from a config dict, rejecting unrecognized keys so typos surface."""
+        unknown = set(config) - {field.name for field in fields(cls)}
+        if unknown:
+            raise ValueError(f"Unknown analysis options: {', '.join(sorted(unknown))}")
+        return cls(**config)
+
+
 async def analyze_website(url: str, 
-                         config: Optional[Dict[str, Any]] = None,
+                         config: Optional[Union[AnalyzeOptions, Dict[str, Any]]] = None,
                          output_dir: Optional[Path] = None) -> Site:
     """Main entry point for website analysis."""
-    analyzer = SiteAnalyzer(
-        output_directory=output_dir,
-        use_dynamic_crawler=config.get("use_dynamic_crawler", True) if config else True,
-        generate_markdown=config.get("generate_markdown", True) if config else True,
-        download_assets=config.get("download_assets", False) if config else False
-    )
+    if not isinstance(config, AnalyzeOptions):
+        config = AnalyzeOptions.from_dict(config or {})
     
-    crawl_config = CrawlConfig(**config.get("crawl_config", {})) if config and "crawl_config" in config else None
-    metadata = AnalysisMetadata(**config.get("metadata", {})) if config and "metadata" in config else None
+    crawl_config = CrawlConfig(**config.crawl_config) if config.crawl_config is not None else None
+    metadata = AnalysisMetadata(**config.metadata) if config.metadata is not None else None
     
-    return await analyzer.analyze_site(url, crawl_config, metadata)
\ No newline at end of file
+    async with SiteAnalyzer(
+        output_directory=output_dir,
+        use_dynamic_crawler=config.use_dynamic_crawler,
+        generate_markdown=config.generate_markdown,
+        download_assets=config.download_assets,
+        use_process_pool=config.use_process_pool,
+        use_cache=config.use_cache,
+        monitor_sample_rate=config.monitor_sample_rate
+    ) as analyzer:
+        return await analyzer.analyze_site(url, crawl_config, metadata)
@@ -1,84 +1,273 @@
 """Dynamic content crawler using Playwright for JavaScript-heavy sites."""
 
 import asyncio
-from typing import Dict, List, Optional, Set, Any
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin
 import json
 
-from playwright.async_api import async_playwright, Browser, BrowserContext, Page as PlaywrightPage
+from playwright.async_api import (
+    async_playwright, Browser, BrowserContext, Error as PlaywrightError, Page as PlaywrightPage,
+    Playwright, TimeoutError as PlaywrightTimeoutError
+)
 from pydantic import HttpUrl
 
 from ..models.site import Site
 from ..models.page import Page
 from ..models.schemas import CrawlStatus, AssetInfo
-from ..utils.validation import is_valid_url, is_same_domain, normalize_url
+from ..utils.error_handling import ErrorCategory, RetryConfig, calculate_delay
+from ..utils.validation import get_domain, http_url, is_valid_url, normalize_url
+
+
+async def launch_browser(playwright: Playwright, browser_engine: str) -> Browser:
+    """Launch a headless browser for the given engine (chromium, firefox or webkit)."""
+    browser_type = getattr(playwright, browser_engine)
+    return await browser_type.launch(
+        headless=True,
+        args=['--no-sandbox', '--disable-dev-shm-usage']
+    )
+
+
+# Elements that indicate a page is still loading its content
+_LOADING_INDICATORS = '[class*="loading"], [class*="spinner"], [id*="loading"], .loader, .preloader'
+
+# Upper bound on waiting for the loading indicators to go away
+_LOADING_INDICATOR_TIMEOUT_MS = 3000
+
+# Upper bound on waiting for network activity to settle after the DOM is ready
+_NETWORK_IDLE_TIMEOUT_MS = 5000
+
+# Resource types the crawler never reads; their URLs still come from the DOM
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font'})
+
+# Matches request URLs that look like API calls (JSON, GraphQL, etc.), case-insensitively
+_API_URL_PATTERN = 'api/|graphql|json|ajax'
+
+# Globals whose presence identifies a JavaScript framework or library
+_FRAMEWORK_CHECKS = {
+    'React': 'window.React',
+    'Vue': 'window.Vue',
+    'Angular': 'window.ng || window.angular',
+    'jQuery': 'window.jQuery || window.$',
+    'Next.js': 'window.__NEXT_DATA__',
+    'Nuxt.js': 'window.__NUXT__',
+    'Svelte': 'window.__SVELTE__',
+    'Gatsby': 'window.___gatsby',
+    'Alpine.js': 'window.Alpine',
+    'Stimulus': 'window.Stimulus',
+    'Turbo': 'window.Turbo'
+}
+
+# Client-side rendering frameworks whose presence means content may still be loading
+_RENDERING_FRAMEWORKS = ('React', 'Vue', 'Angular', 'Next.js', 'Nuxt.js', 'Svelte', 'Gatsby')
+
+# Mount points used by single-page apps, which bundles often leave without globals
+_APP_ROOTS = '#root, #app, #__next, #__nuxt, #___gatsby, [data-reactroot], [ng-version]'
+
+# Pages with at most this many scripts and no signs of client rendering skip the waits
+_STATIC_PAGE_MAX_SCRIPTS = 5
+
+# True when the page looks server-rendered, so its DOM is complete once it has loaded.
+# Pages already calling APIs are not, so their late requests get the same network-idle
+# wait before the resource timeline is read for api_endpoints.
+_STATIC_PAGE_PROBE = '''
+    () => document.scripts.length <= ''' + str(_STATIC_PAGE_MAX_SCRIPTS) + '''
+        && !document.querySelector(''' + json.dumps(_LOADING_INDICATORS + ', ' + _APP_ROOTS) + ''')
+        && !(''' + ' || '.join(_FRAMEWORK_CHECKS[name] for name in _RENDERING_FRAMEWORKS) + ''')
+        && !performance.getEntriesByType('resource')
+            .some(entry => new RegExp(''' + json.dumps(_API_URL_PATTERN) + ''', 'i').test(entry.name))
+'''
+
+# Collects everything the crawler reads from a rendered page in a single driver
+# round-trip. Each section is guarded so a failing probe only loses its own data.
+_PAGE_DATA_SCRIPT = '''
+    () => {
+        const guard = (collect, fallback) => {
+            try {
+                return collect();
+            } catch (e) {
+                return fallback;
+            }
+        };
+        const attribute = (selector, name) => {
+            const element = document.querySelector(selector);
+            return element ? element.getAttribute(name) : null;
+        };
+        
+        return {
+            seo: guard(() => ({
+                description: attribute('meta[name="description"]', 'content'),
+                keywords: attribute('meta[name="keywords"]', 'content'),
+                og_title: attribute('meta[property="og:title"]', 'content'),
+                og_description: attribute('meta[property="og:description"]', 'content'),
+                og_image: attribute('meta[property="og:image"]', 'content'),
+                canonical_url: attribute('link[rel="canonical"]', 'href')
+            }), {}),
+            
+            frameworks: {
+''' + ',\n'.join(
+    f'                "{name}": guard(() => typeof ({check}) !== "undefined", false)'
+    for name, check in _FRAMEWORK_CHECKS.items()
+) + '''
+            },
+            
+            performance: guard(() => {
+                const timing = performance.timing;
+                const navigation = performance.getEntriesByType('navigation')[0];
+                
+                return {
+                    page_load_time: timing.loadEventEnd - timing.navigationStart,
+                    dom_content_loaded: timing.domContentLoadedEventEnd - timing.navigationStart,
+                    first_paint: performance.getEntriesByName('first-paint')[0]?.startTime || null,
+                    first_contentful_paint: performance.getEntriesByName('first-contentful-paint')[0]?.startTime || null,
+                    dom_size: document.querySelectorAll('*').length,
+                    script_count: document.querySelectorAll('script').length,
+                    stylesheet_count: document.querySelectorAll('link[rel="stylesheet"]').length,
+                    image_count: document.querySelectorAll('img').length,
+                    resource_count: navigation ? navigation.transferSize : null
+                };
+            }, {}),
+            
+            // Requests the page made while loading, read from the resource timeline
+            api_requests: guard(() => {
+                const apiPattern = new RegExp(''' + json.dumps(_API_URL_PATTERN) + ''', 'i');
+                const urls = performance.getEntriesByType('resource')
+                    .map(entry => entry.name)
+                    .filter(url => apiPattern.test(url));
+                return Array.from(new Set(urls));
+            }, []),
+            
+            links: guard(() => Array.from(document.querySelectorAll('a[href]')).map(link => ({
+                href: link.href,
+                text: link.textContent.trim()
+            })), []),
+            
+            assets: guard(() => {
+                const assets = [];
+                
+                // Images
+                document.querySelectorAll('img[src]').forEach(img => {
+                    assets.push({
+                        url: img.src,
+                        type: 'image',
+                        alt_text: img.alt || '',
+                        // Image bytes are blocked, so use the declared size
+                        width: parseInt(img.getAttribute('width'), 10) || null,
+                        height: parseInt(img.getAttribute('height'), 10) || null
+                    });
+                });
+                
+                // CSS files
+                document.querySelectorAll('link[rel="stylesheet"][href]').forEach(css => {
+                    assets.push({
+                        url: css.href,
+                        type: 'css'
+                    });
+                });
+                
+                // JavaScript files
+                document.querySelectorAll('script[src]').forEach(script => {
+                    assets.push({
+                        url: script.src,
+                        type: 'javascript'
+                    });
+                });
+                
+                return assets;
+            }, [])
+        };
+    }
+'''
+
+# The page-data script is installed once per browser context under this global, so
+# each page only sends a short call over the driver connection
+_PAGE_DATA_GLOBAL = '__getsitedna_page_data'
+_PAGE_DATA_INIT_SCRIPT = f'window.{_PAGE_DATA_GLOBAL} = {_PAGE_DATA_SCRIPT.strip()};'
+_PAGE_DATA_CALL = f'() => window.{_PAGE_DATA_GLOBAL} ? window.{_PAGE_DATA_GLOBAL}() : null'
+
+
+def _navigation_error_category(error: PlaywrightError) -> ErrorCategory:
+    """Classify a failed navigation: timeouts and net:: errors are network problems."""
+    if isinstance(error, PlaywrightTimeoutError) or 'net::' in str(error):
+        return ErrorCategory.NETWORK
+    return ErrorCategory.BROWSER
 
 
 class DynamicCrawler:
     """Dynamic content crawler for JavaScript-heavy websites."""
     
-    def __init__(self, site: Site):
+    # Pooled tabs are closed and replaced after this many page loads to bound memory growth
+    PAGE_RECYCLE_AFTER = 25
+    
+    def __init__(self,
+                 site: Site,
+                 on_page_crawled: Optional[Callable[[Page], None]] = None,
+                 retry_config: Optional[RetryConfig] = None,
+                 browser: Optional[Browser] = None):
         self.site = site
-        self.browser: Optional[Browser] = None
+        self.on_page_crawled = on_page_crawled
+        self.retry_config = retry_config or RetryConfig(max_attempts=3, base_delay=1.0, max_delay=10.0)
+        self.browser: Optional[Browser] = browser
         self.context: Optional[BrowserContext] = None
+        self._page_pool: Optional[asyncio.Queue] = None
+        self._crawl_queue: Optional[asyncio.Queue] = None
+        self.base_domain = get_domain(str(site.base_url))
         self.discovered_urls: Set[str] = set()
         self.crawled_urls: Set[str] = set()
-        self.network_requests: Dict[str, List[str]] = {}  # Track API calls per page
         
     async def crawl_site(self) -> Site:
         """Crawl the site using Playwright for dynamic content."""
+        if self.browser is not None:
+            # Browser supplied and owned by the caller; it stays open after the crawl
+            await self._crawl_with_browser()
+            return self.site
+        
         async with async_playwright() as p:
             try:
-                # Launch browser
-                browser_type = getattr(p, self.site.config.browser_engine)
-                self.browser = await browser_type.launch(
-                    headless=True,
-                    args=['--no-sandbox', '--disable-dev-shm-usage']
-                )
-                
-                # Create context with realistic settings
-                self.context = await self.browser.new_context(
-                    viewport={'width': 1920, 'height': 1080},
-                    user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
-                )
-                
-                # Enable request interception for API discovery
-                await self._setup_request_interception()
-                
-                # Start crawling from base URL
-                await self._discover_initial_urls()
-                
-                # Crawl pages with depth control
-                await self._crawl_by_depth()
-                
+                self.browser = await launch_browser(p, self.site.config.browser_engine)
+                await self._crawl_with_browser()
                 return self.site
                 
             finally:
-                if self.context:
-                    await self.context.close()
                 if self.browser:
                     await self.browser.close()
     
-    async def _setup_request_interception(self):
-        """Set up request interception to track API calls and assets."""
-        self.context.on('request', self._handle_request)
-        self.context.on('response', self._handle_response)
-    
-    async def _handle_request(self, request):
-        """Handle intercepted requests to track API calls."""
-        url = request.url
-        
-        # Track API endpoints (JSON, GraphQL, etc.)
-        if any(keyword in url.lower() for keyword in ['api/', 'graphql', 'json', 'ajax']):
-            page_url = request.frame.url if request.frame else "unknown"
-            if page_url not in self.network_requests:
-                self.network_requests[page_url] = []
-            self.network_requests[page_url].append(url)
+    async def _crawl_with_browser(self):
+        """Crawl the site in a fresh browser context."""
+        try:
+            # Create context with realistic settings
+            self.context = await self.browser.new_context(
+                viewport={'width': 1920, 'height': 1080},
+                user_agent='Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
+            )
+            
+            # Skip downloading images, media and fonts
+            await self.context.route('**/*', self._route_request)
+            
+            # Define the page-data collector in every page the context opens
+            await self.context.add_init_script(_PAGE_DATA_INIT_SCRIPT)
+            
+            # One reusable tab per concurrent request; the pool size bounds concurrency.
+            # Empty slots open a tab on first use.
+            self._page_pool = asyncio.Queue()
+            for _ in range(self.site.config.concurrent_requests):
+                self._page_pool.put_nowait((None, 0))
+            
+            # Start crawling from base URL
+            await self._discover_initial_urls()
+            
+            # Crawl pages with depth control
+            await self._crawl_by_depth()
+            
+        finally:
+            if self.context:
+                await self.context.close()
     
-    async def _handle_response(self, response):
-        """Handle responses to analyze content types and performance."""
-        # Could be used for performance metrics in the future
-        pass
+    async def _route_request(self, route):
+        """Abort requests for resources whose bytes the crawler never uses."""
+        if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+            await route.abort()
+        else:
+            await route.continue_()
     
     async def _discover_initial_urls(self):
         """Discover initial URLs including the base URL."""
@@ -97,81 +286,125 @@ class DynamicCrawler:
             return
         
         # Check domain
-        if not is_same_domain(normalized_url, str(self.site.base_url)):
+        if get_domain(normalized_url) != self.base_domain:
             return
         
+        self._add_discovered_urls([normalized_url], depth, parent_url)
+    
+    def _add_discovered_urls(self, urls: List[str], depth: int, parent_url: Optional[str] = None):
+        """Add normalized, valid, same-domain URLs found together to the crawl queue."""
         # Check depth limit
         if depth > self.site.config.max_depth:
             return
         
-        # Check page limit
-        if len(self.discovered_urls) >= self.site.config.max_pages:
-            return
-        
-        # Add to discovered URLs
-        self.discovered_urls.add(normalized_url)
-        
-        # Create or update page object
-        if not self.site.has_page(normalized_url):
-            page = Page(
-                url=HttpUrl(normalized_url),
-                depth=depth,
-                parent_url=HttpUrl(parent_url) if parent_url else None,
-            )
-            self.site.add_page(page)
-    
-    async def _crawl_by_depth(self):
-        """Crawl pages level by level to respect depth limits."""
-        for depth in range(self.site.config.max_depth + 1):
-            pages_at_depth = self.site.get_pages_by_depth(depth)
-            uncrawled_pages = [p for p in pages_at_depth if p.status == CrawlStatus.PENDING]
+        parent = HttpUrl(parent_url) if parent_url else None
+        for url in urls:
+            # Check page limit
+            if len(self.discovered_urls) >= self.site.config.max_pages:
+                return
             
-            if not uncrawled_pages:
+            if url in self.discovered_urls:
                 continue
+            self.discovered_urls.add(url)
             
-            # Process pages with concurrency control
-            semaphore = asyncio.Semaphore(self.site.config.concurrent_requests)
-            tasks = []
-            
-            for page in uncrawled_pages:
-                if len(self.crawled_urls) >= self.site.config.max_pages:
-                    break
+            # Create or update page object
+            if not self.site.has_page(url):
+                page = Page(url=HttpUrl(url), depth=depth, parent_url=parent)
+                self.site.add_page(page)
                 
-                task = self._crawl_page_with_semaphore(semaphore, page)
-                tasks.append(task)
-            
-            # Wait for all pages at this depth to complete
-            if tasks:
-                await asyncio.gather(*tasks, return_exceptions=True)
+                # Queue it straight away when a crawl is running
+                if self._crawl_queue is not None:
+                    self._crawl_queue.put_nowait(page)
+    
+    async def _crawl_by_depth(self):
+        """Crawl pages breadth-first, starting each one as soon as a tab is free.
+        
+        Pages discovered during the crawl are queued directly, so a slow page no
+        longer holds back the whole next depth level.
+        """
+        self._crawl_queue = asyncio.Queue()
+        for page in sorted(self.site.get_uncrawled_pages(), key=lambda p: p.depth):
+            self._crawl_queue.put_nowait(page)
+        
+        # One worker per pooled tab keeps every tab busy while work is queued
+        workers = [
+            asyncio.ensure_future(self._crawl_worker())
+            for _ in range(self.site.config.concurrent_requests)
+        ]
+        
+        try:
+            await self._crawl_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._crawl_queue = None
+    
+    async def _crawl_worker(self):
+        """Crawl queued pages until cancelled."""
+        while True:
+            page = await self._crawl_queue.get()
+            try:
+                if (page.depth <= self.site.config.max_depth
+                        and len(self.crawled_urls) < self.site.config.max_pages):
+                    await self._crawl_page(page)
+            except Exception as e:
+                page.status = CrawlStatus.FAILED
+                page.add_error(f"Dynamic crawl failed: {e}")
+            finally:
+                self._crawl_queue.task_done()
+    
+    async def _acquire_page(self) -> Tuple[PlaywrightPage, int]:
+        """Take a tab and its use count from the pool, opening one for an empty slot."""
+        playwright_page, uses = await self._page_pool.get()
+        if playwright_page is None:
+            try:
+                playwright_page = await self.context.new_page()
+            except Exception:
+                self._page_pool.put_nowait((None, 0))
+                raise
             
-            # Rate limiting between depth levels
-            if depth < self.site.config.max_depth:
-                await asyncio.sleep(self.site.config.rate_limit_delay)
+            # Set timeout
+            playwright_page.set_default_timeout(self.site.config.timeout * 1000)
+        
+        return playwright_page, uses
     
-    async def _crawl_page_with_semaphore(self, semaphore: asyncio.Semaphore, page: Page):
-        """Crawl a page with concurrency control."""
-        async with semaphore:
-            await self._crawl_page(page)
+    async def _release_page(self, playwright_page: PlaywrightPage, uses: int, reusable: bool):
+        """Return a tab to the pool, replacing it after a failure or once it is worn out."""
+        uses += 1
+        if reusable and uses < self.PAGE_RECYCLE_AFTER:
+            try:
+                # Unload the previous document so its scripts and requests stop
+                await playwright_page.goto('about:blank')
+                self._page_pool.put_nowait((playwright_page, uses))
+                return
+            except PlaywrightError:
+                pass
+        
+        try:
+            await playwright_page.close()
+        except PlaywrightError:
+            pass
+        self._page_pool.put_nowait((None, 0))
     
     async def _crawl_page(self, page: Page):
         """Crawl a single page with Playwright."""
-        url = str(page.url)
+        url = page.url_str
         
         if url in self.crawled_urls:
             return
         
         playwright_page = None
+        uses = 0
+        reusable = True
         try:
             page.status = CrawlStatus.CRAWLING
             
-            # Create new page
-            playwright_page = await self.context.new_page()
-            
-            # Set timeout
-            playwright_page.set_default_timeout(self.site.config.timeout * 1000)
+            # Take a tab from the pool
+            playwright_page, uses = await self._acquire_page()
             
             # Navigate to page
-            response = await playwright_page.goto(url, wait_until='networkidle')
+            response = await self._goto_with_retry(playwright_page, url)
             
             if not response:
                 page.add_error("Failed to load page")
@@ -185,91 +418,80 @@ class DynamicCrawler:
                 page.add_error(f"HTTP {response.status}")
                 return
             
-            # Wait for dynamic content to load
-            await self._wait_for_dynamic_content(playwright_page)
+            # Wait for dynamic content to load, unless the page is server-rendered
+            if not await self._is_static_page(playwright_page):
+                await self._wait_for_dynamic_content(playwright_page)
             
             # Extract content after JavaScript execution
-            await self._extract_dynamic_content(page, playwright_page)
+            page_data = await self._extract_dynamic_content(page, playwright_page)
             
             # Extract links for further crawling
-            await self._extract_dynamic_links(page, playwright_page)
+            self._extract_dynamic_links(page, page_data.get('links') or [])
             
             # Extract assets
-            await self._extract_dynamic_assets(page, playwright_page)
-            
-            # Track API endpoints discovered during page load
-            if url in self.network_requests:
-                page.technical.api_endpoints = self.network_requests[url]
+            self._extract_dynamic_assets(page, page_data.get('assets') or [])
             
             self.crawled_urls.add(url)
             
+            # Hand the finished page to any downstream consumer
+            if self.on_page_crawled:
+                self.on_page_crawled(page)
+            
         except Exception as e:
+            reusable = False
             page.status = CrawlStatus.FAILED
             page.add_error(f"Dynamic crawl failed: {e}")
             
         finally:
             if playwright_page:
-                await playwright_page.close()
+                await self._release_page(playwright_page, uses, reusable)
+    
+    async def _goto_with_retry(self, playwright_page: PlaywrightPage, url: str):
+        """Navigate to a URL, retrying failed loads with jittered exponential backoff."""
+        for attempt in range(self.retry_config.max_attempts):
+            try:
+                return await playwright_page.goto(url, wait_until='domcontentloaded')
+            except PlaywrightError as e:
+                if attempt == self.retry_config.max_attempts - 1:
+                    raise
+                category = _navigation_error_category(e)
+                await asyncio.sleep(calculate_delay(attempt, self.retry_config, category))
+    
+    async def _is_static_page(self, playwright_page: PlaywrightPage) -> bool:
+        """Check whether a page has few scripts and no client-side rendering markers."""
+        try:
+            return await playwright_page.evaluate(_STATIC_PAGE_PROBE) is True
+        except PlaywrightError:
+            return False
     
     async def _wait_for_dynamic_content(self, playwright_page: PlaywrightPage):
         """Wait for dynamic content to fully load."""
         try:
-            # Wait for common loading indicators to disappear
-            loading_selectors = [
-                '[class*="loading"]',
-                '[class*="spinner"]',
-                '[id*="loading"]',
-                '.loader',
-                '.preloader'
-            ]
-            
-            for selector in loading_selectors:
-                try:
-                    await playwright_page.wait_for_selector(selector, state='detached', timeout=5000)
-                except:
-                    pass  # Selector not found or timeout, continue
-            
-            # Wait for network to be idle
-            await playwright_page.wait_for_load_state('networkidle')
-            
-            # Additional wait for common JavaScript frameworks
-            await self._wait_for_frameworks(playwright_page)
+            # Wait for all common loading indicators to disappear, in one browser-side check
+            try:
+                await playwright_page.wait_for_function(
+                    'selector => !document.querySelector(selector)',
+                    arg=_LOADING_INDICATORS,
+                    timeout=_LOADING_INDICATOR_TIMEOUT_MS
+                )
+            except PlaywrightError:
+                pass  # Indicators still present after the timeout, continue
+            
+            # Navigation only waits for the DOM, so give late requests a bounded chance to settle
+            try:
+                await playwright_page.wait_for_load_state('networkidle', timeout=_NETWORK_IDLE_TIMEOUT_MS)
+            except PlaywrightError:
+                pass
             
         except Exception as e:
             # Don't fail the entire crawl if waiting fails
             pass
     
-    async def _wait_for_frameworks(self, playwright_page: PlaywrightPage):
-        """Wait for common JavaScript frameworks to finish rendering."""
-        # React
-        try:
-            await playwright_page.wait_for_function(
-                'window.React || document.querySelector("[data-reactroot]") || document.querySelector(".react-app")',
-                timeout=3000
-            )
-        except:
-            pass
+    async def _extract_dynamic_content(self, page: Page, playwright_page: PlaywrightPage) -> Dict[str, Any]:
+        """Extract content after JavaScript execution.
         
-        # Vue
-        try:
-            await playwright_page.wait_for_function(
-                'window.Vue || document.querySelector("[data-v-]") || document.querySelector("#app")',
-                timeout=3000
-            )
-        except:
-            pass
-        
-        # Angular
-        try:
-            await playwright_page.wait_for_function(
-                'window.ng || document.querySelector("[ng-app]") || document.querySelector("app-root")',
-                timeout=3000
-            )
-        except:
-            pass
-    
-    async def _extract_dynamic_content(self, page: Page, playwright_page: PlaywrightPage):
-        """Extract content after JavaScript execution."""
+        Returns the page data collected in the browser, for link and asset extraction.
+        """
         # Get rendered HTML
         page.rendered_html = await playwright_page.content()
         page.html_content = page.rendered_html  # Use rendered HTML as primary content
@@ -278,192 +500,92 @@ class DynamicCrawler:
         # Extract page title
         page.title = await playwright_page.title()
         
+        # Collect meta tags, frameworks, metrics, API requests, links and assets in one evaluate call
+        try:
+            page_data = await playwright_page.evaluate(_PAGE_DATA_CALL)
+            if page_data is None:
+                # Collector not installed (page opened outside the crawl context)
+                page_data = await playwright_page.evaluate(_PAGE_DATA_SCRIPT)
+        except PlaywrightError as e:
+            page.add_warning(f"Failed to collect page data: {e}")
+            page_data = {}
+        
         # Extract meta information
-        await self._extract_meta_tags(page, playwright_page)
+        self._extract_meta_tags(page, page_data.get('seo') or {})
         
         # Detect JavaScript frameworks
-        frameworks = await self._detect_frameworks(playwright_page)
-        page.technical.javascript_frameworks = frameworks
+        page.technical.javascript_frameworks = self._detect_frameworks(page_data.get('frameworks') or {})
         
         # Extract performance metrics
-        performance_metrics = await self._extract_performance_metrics(playwright_page)
-        page.technical.performance_metrics = performance_metrics
+        page.technical.performance_metrics = page_data.get('performance') or {}
+        
+        # Track API endpoints requested during page load
+        page.technical.api_endpoints = page_data.get('api_requests') or []
+        
+        return page_data
     
-    async def _extract_meta_tags(self, page: Page, playwright_page: PlaywrightPage):
-        """Extract meta tags and SEO information."""
+    def _extract_meta_tags(self, page: Page, seo_data: Dict[str, Optional[str]]):
+        """Apply meta tags and SEO information collected from the page."""
         # Description
-        try:
-            desc_element = await playwright_page.query_selector('meta[name="description"]')
-            if desc_element:
-                page.seo.description = await desc_element.get_attribute('content')
-        except:
-            pass
+        description = seo_data.get('description')
+        if description is not None:
+            page.seo.description = description
         
         # Keywords
-        try:
-            keywords_element = await playwright_page.query_selector('meta[name="keywords"]')
-            if keywords_element:
-                keywords_content = await keywords_element.get_attribute('content')
-                if keywords_content:
-                    page.seo.keywords = [k.strip() for k in keywords_content.split(',')]
-        except:
-            pass
+        keywords_content = seo_data.get('keywords')
+        if keywords_content:
+            page.seo.keywords = [k.strip() for k in keywords_content.split(',')]
         
         # Open Graph
-        og_tags = {
-            'og:title': 'og_title',
-            'og:description': 'og_description',
-            'og:image': 'og_image'
-        }
-        
-        for og_property, attr_name in og_tags.items():
-            try:
-                element = await playwright_page.query_selector(f'meta[property="{og_property}"]')
-                if element:
-                    content = await element.get_attribute('content')
-                    if content:
-                        setattr(page.seo, attr_name, content)
-            except:
-                pass
+        for attr_name in ('og_title', 'og_description', 'og_image'):
+            content = seo_data.get(attr_name)
+            if content:
+                setattr(page.seo, attr_name, content)
         
         # Canonical URL
-        try:
-            canonical_element = await playwright_page.query_selector('link[rel="canonical"]')
-            if canonical_element:
-                canonical_href = await canonical_element.get_attribute('href')
-                if canonical_href:
-                    page.seo.canonical_url = HttpUrl(canonical_href)
-        except:
-            pass
-    
-    async def _detect_frameworks(self, playwright_page: PlaywrightPage) -> List[str]:
-        """Detect JavaScript frameworks and libraries."""
-        frameworks = []
-        
-        # Check for various frameworks and libraries
-        framework_checks = {
-            'React': 'window.React',
-            'Vue': 'window.Vue',
-            'Angular': 'window.ng || window.angular',
-            'jQuery': 'window.jQuery || window.$',
-            'Next.js': 'window.__NEXT_DATA__',
-            'Nuxt.js': 'window.__NUXT__',
-            'Svelte': 'window.__SVELTE__',
-            'Gatsby': 'window.___gatsby',
-            'Alpine.js': 'window.Alpine',
-            'Stimulus': 'window.Stimulus',
-            'Turbo': 'window.Turbo'
-        }
-        
-        for framework_name, check_script in framework_checks.items():
+        canonical_href = seo_data.get('canonical_url')
+        if canonical_href:
             try:
-                result = await playwright_page.evaluate(f'typeof ({check_script}) !== "undefined"')
-                if result:
-                    frameworks.append(framework_name)
-            except:
+                page.seo.canonical_url = HttpUrl(canonical_href)
+            except ValueError:
                 pass
-        
-        return frameworks
     
-    async def _extract_performance_metrics(self, playwright_page: PlaywrightPage) -> Dict[str, Any]:
-        """Extract performance metrics using Navigation Timing API."""
-        try:
-            metrics = await playwright_page.evaluate('''
-                () => {
-                    const timing = performance.timing;
-                    const navigation = performance.getEntriesByType('navigation')[0];
-                    
-                    return {
-                        page_load_time: timing.loadEventEnd - timing.navigationStart,
-                        dom_content_loaded: timing.domContentLoadedEventEnd - timing.navigationStart,
-                        first_paint: performance.getEntriesByName('first-paint')[0]?.startTime || null,
-                        first_contentful_paint: performance.getEntriesByName('first-contentful-paint')[0]?.startTime || null,
-                        dom_size: document.querySelectorAll('*').length,
-                        script_count: document.querySelectorAll('script').length,
-                        stylesheet_count: document.querySelectorAll('link[rel="stylesheet"]').length,
-                        image_count: document.querySelectorAll('img').length,
-                        resource_count: navigation ? navigation.transferSize : null
-                    };
-                }
-            ''')
-            return metrics
-        except:
-            return {}
+    def _detect_frameworks(self, framework_flags: Dict[str, bool]) -> List[str]:
+        """List the JavaScript frameworks and libraries detected on the page."""
+        return [name for name in _FRAMEWORK_CHECKS if framework_flags.get(name)]
     
-    async def _extract_dynamic_links(self, page: Page, playwright_page: PlaywrightPage):
+    def _extract_dynamic_links(self, page: Page, links: List[Dict[str, str]]):
         """Extract links from the dynamically rendered page."""
         try:
-            links = await playwright_page.evaluate('''
-                () => {
-                    const links = Array.from(document.querySelectorAll('a[href]'));
-                    return links.map(link => ({
-                        href: link.href,
-                        text: link.textContent.trim()
-                    }));
-                }
-            ''')
-            
-            for link_data in links:
-                href = link_data['href']
+            new_urls = []
+            
+            # Nav and footer templates repeat the same hrefs on every page
+            for href in dict.fromkeys(link_data['href'] for link_data in links):
                 normalized_url = normalize_url(href)
                 
+                # Discovered URLs were already validated as same-domain
+                if normalized_url in self.discovered_urls:
+                    page.add_internal_link(http_url(normalized_url))
+                    continue
+                
                 if not is_valid_url(normalized_url):
                     continue
                 
-                if is_same_domain(normalized_url, str(self.site.base_url)):
-                    page.add_internal_link(HttpUrl(normalized_url))
-                    
-                    # Add to crawl queue if not already discovered
-                    if normalized_url not in self.discovered_urls:
-                        self._add_discovered_url(
-                            normalized_url,
-                            depth=page.depth + 1,
-                            parent_url=str(page.url)
-                        )
+                if get_domain(normalized_url) == self.base_domain:
+                    page.add_internal_link(http_url(normalized_url))
+                    new_urls.append(normalized_url)
                 else:
-                    page.add_external_link(HttpUrl(normalized_url))
-                    
+                    page.add_external_link(http_url(normalized_url))
+            
+            # Queue the new internal links in one batch; they are already validated
+            self._add_discovered_urls(new_urls, depth=page.depth + 1, parent_url=page.url_str)
+            
         except Exception as e:
             page.add_warning(f"Failed to extract dynamic links: {e}")
     
-    async def _extract_dynamic_assets(self, page: Page, playwright_page: PlaywrightPage):
+    def _extract_dynamic_assets(self, page: Page, assets: List[Dict[str, Any]]):
         """Extract assets from the dynamically rendered page."""
         try:
-            assets = await playwright_page.evaluate('''
-                () => {
-                    const assets = [];
-                    
-                    // Images
-                    document.querySelectorAll('img[src]').forEach(img => {
-                        assets.push({
-                            url: img.src,
-                            type: 'image',
-                            alt_text: img.alt || '',
-                            width: img.naturalWidth || null,
-                            height: img.naturalHeight || null
-                        });
-                    });
-                    
-                    // CSS files
-                    document.querySelectorAll('link[rel="stylesheet"][href]').forEach(css => {
-                        assets.push({
-                            url: css.href,
-                            type: 'css'
-                        });
-                    });
-                    
-                    // JavaScript files
-                    document.querySelectorAll('script[src]').forEach(script => {
-                        assets.push({
-                            url: script.src,
-                            type: 'javascript'
-                        });
-                    });
-                    
-                    return assets;
-                }
-            ''')
-            
             for asset_data in assets:
                 asset = AssetInfo(
                     url=asset_data['url'],
@@ -1,77 +1,302 @@
-"""Static HTML crawler using BeautifulSoup."""
+"""Static HTML crawler using lxml."""
 
 import asyncio
-from typing import Dict, List, Optional, Set
+import re
+import sys
+from concurrent.futures import Executor
+from contextlib import AsyncExitStack, asynccontextmanager
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 from urllib.parse import urljoin, urlparse
 import xml.etree.ElementTree as ET
 
-import requests
-from bs4 import BeautifulSoup, Tag
+import aiohttp
+import lxml.html
+from lxml import etree
 from pydantic import HttpUrl
 
 from ..models.site import Site
 from ..models.page import Page
 from ..models.schemas import CrawlStatus, AssetInfo
-from ..utils.http import HTTPSession, RobotsChecker
-from ..utils.validation import is_valid_url, is_same_domain, resolve_url, normalize_url
-from ..utils.cache import cached, file_cache
-from ..utils.performance import ConcurrentProcessor, performance_context
+from ..utils.error_handling import ErrorCategory, RetryConfig, calculate_delay
+from ..utils.http import AsyncHTTPSession, RobotsChecker
+from ..utils.validation import get_domain, http_url, is_valid_url, resolve_url, normalize_url
+from ..utils.cache import file_cache
+from ..utils.performance import performance_context
+
+
+# Element tags of the sitemap protocol, in ElementTree's {namespace}name form
+_SITEMAP_NS = '{http://www.sitemaps.org/schemas/sitemap/0.9}'
+_SITEMAP_LOC = _SITEMAP_NS + 'loc'
+_SITEMAP_URL = _SITEMAP_NS + 'url'
+_SITEMAP_SITEMAP = _SITEMAP_NS + 'sitemap'
+
+# Bytes read from a sitemap response per parser feed
+_SITEMAP_CHUNK_SIZE = 64 * 1024
+
+# Most sitemaps fetched per crawl, so huge sitemap indexes can't fan out forever
+_MAX_SITEMAPS = 100
+
+# Bytes read from a page response per chunk
+_BODY_CHUNK_SIZE = 64 * 1024
+
+# Response statuses worth retrying a page fetch on
+_RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Page text is re-encoded as UTF-8 before parsing, which also lets lxml accept
+# XHTML documents that carry their own encoding declaration
+_HTML_PARSER = lxml.html.HTMLParser(encoding='utf-8')
+
+# Cheap visible-text extraction for near-duplicate detection, run before parsing
+_INVISIBLE_BLOCK_RE = re.compile(r'<(script|style)\b.*?</\1\s*>', re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r'<[^>]+>')
+_WORD_RE = re.compile(r'\w+')
+
+# Words per content shingle, and the Jaccard similarity to a single crawled
+# page that marks a page as a near-duplicate of it
+_SHINGLE_SIZE = 13
+_DUPLICATE_THRESHOLD = 0.9
+
+
+def parse_html(html: str) -> lxml.html.HtmlElement:
+    """Parse page text into an lxml document tree."""
+    return lxml.html.document_fromstring(html.encode('utf-8'), parser=_HTML_PARSER)
+
+
+def _rel_has(token: str) -> str:
+    """XPath predicate matching elements whose space-separated rel contains token."""
+    return f"contains(concat(' ', normalize-space(@rel), ' '), ' {token} ')"
+
+
+def _first_attr_xpath(path: str, attr: str) -> etree.XPath:
+    """Compile an XPath returning attr of the first element matching path, or ''."""
+    return etree.XPath(f"string(({path})[1]/@{attr})", smart_strings=False)
+
+
+# Compiled once; each returns the page's value, or '' when the tag or attribute is
+# missing. Like all string results below, values are plain str rather than lxml
+# smart strings, which would keep the tree alive and can't leave a process pool.
+_XP_TITLE = etree.XPath('(//title)[1]')
+_XP_DESCRIPTION = _first_attr_xpath("//meta[@name='description']", 'content')
+_XP_KEYWORDS = _first_attr_xpath("//meta[@name='keywords']", 'content')
+_XP_OG_TITLE = _first_attr_xpath("//meta[@property='og:title']", 'content')
+_XP_OG_DESCRIPTION = _first_attr_xpath("//meta[@property='og:description']", 'content')
+_XP_OG_IMAGE = _first_attr_xpath("//meta[@property='og:image']", 'content')
+_XP_CANONICAL = _first_attr_xpath(f"//link[{_rel_has('canonical')}]", 'href')
+
+# SEOMetadata fields and the queries that read them
+_SEO_XPATHS = (
+    ('description', _XP_DESCRIPTION),
+    ('keywords', _XP_KEYWORDS),
+    ('og_title', _XP_OG_TITLE),
+    ('og_description', _XP_OG_DESCRIPTION),
+    ('og_image', _XP_OG_IMAGE),
+    ('canonical_url', _XP_CANONICAL),
+)
+
+# Link and asset queries, also compiled once. Where only one attribute is needed
+# the query returns its values directly instead of elements to read it from.
+_XP_LINK_HREFS = etree.XPath('//a/@href', smart_strings=False)
+_XP_IMAGES = etree.XPath('//img[@src]')
+_XP_STYLESHEET_HREFS = etree.XPath(f"//link[{_rel_has('stylesheet')}]/@href", smart_strings=False)
+_XP_SCRIPT_SRCS = etree.XPath('//script/@src', smart_strings=False)
+
+
+def extract_page_data(html: str, page_url: str, base_netloc: str,
+                      include_assets: bool = True) -> Dict[str, Any]:
+    """Parse a page and extract its basic info, links and assets as plain data.
+    
+    Module-level and free of crawler state so it can run in a process pool; only
+    strings, lists and dicts cross the process boundary. Assets are only
+    extracted when include_assets is set.
+    """
+    tree = parse_html(html)
+    title, seo = _extract_basic_info(tree)
+    internal_links, external_links = _extract_links(tree, page_url, base_netloc)
+    
+    return {
+        'title': title,
+        'seo': seo,
+        'internal_links': internal_links,
+        'external_links': external_links,
+        'assets': _extract_assets(tree, page_url) if include_assets else [],
+    }
+
+
+def _extract_basic_info(tree: lxml.html.HtmlElement) -> Tuple[Optional[str], Dict[str, Any]]:
+    """Extract the title and the SEO metadata fields the page sets."""
+    # Title
+    titles = _XP_TITLE(tree)
+    title = titles[0].text_content().strip() if titles else None
+    
+    # Meta description, keywords, Open Graph and canonical URL
+    seo = {}
+    for field, xpath in _SEO_XPATHS:
+        value = xpath(tree)
+        if value:
+            seo[field] = value
+    
+    if 'keywords' in seo:
+        seo['keywords'] = [k.strip() for k in seo['keywords'].split(',')]
+    
+    return title, seo
+
+
+def _extract_links(tree: lxml.html.HtmlElement, page_url: str,
+                   base_netloc: str) -> Tuple[List[str], List[str]]:
+    """Extract the page's valid links, split into internal and external URLs."""
+    internal_links = []
+    external_links = []
+    
+    for href in _XP_LINK_HREFS(tree):
+        absolute_url = resolve_url(page_url, href)
+        normalized_url = normalize_url(absolute_url)
+        
+        if not is_valid_url(normalized_url):
+            continue
+        
+        if get_domain(normalized_url) == base_netloc:
+            internal_links.append(normalized_url)
+        else:
+            external_links.append(normalized_url)
+    
+    return internal_links, external_links
+
+
+def _extract_assets(tree: lxml.html.HtmlElement, page_url: str) -> List[Dict[str, Any]]:
+    """Extract image, stylesheet and script assets as AssetInfo fields."""
+    assets = []
+    
+    # Images
+    for img in _XP_IMAGES(tree):
+        attrs = img.attrib
+        asset = {
+            'url': resolve_url(page_url, attrs['src']),
+            'type': "image",
+            'alt_text': attrs.get('alt', ''),
+        }
+        
+        # Try to extract dimensions
+        width = attrs.get('width')
+        height = attrs.get('height')
+        if width and height:
+            try:
+                asset['dimensions'] = (int(width), int(height))
+            except ValueError:
+                pass
+        
+        assets.append(asset)
+    
+    # CSS files
+    for href in _XP_STYLESHEET_HREFS(tree):
+        assets.append({'url': resolve_url(page_url, href), 'type': "css"})
+    
+    # JavaScript files
+    for src in _XP_SCRIPT_SRCS(tree):
+        assets.append({'url': resolve_url(page_url, src), 'type': "javascript"})
+    
+    return assets
+
+
+def _conditional_headers(cached_page: Optional[Dict[str, Any]]) -> Dict[str, str]:
+    """Build revalidation headers from a page stored by an earlier crawl."""
+    headers = {}
+    if cached_page:
+        if cached_page['etag']:
+            headers['If-None-Match'] = cached_page['etag']
+        if cached_page['last_modified']:
+            headers['If-Modified-Since'] = cached_page['last_modified']
+    return headers
 
 
 class StaticCrawler:
     """Static HTML crawler for traditional websites."""
     
-    def __init__(self, site: Site):
+    def __init__(self,
+                 site: Site,
+                 on_page_crawled: Optional[Callable[[Page], None]] = None,
+                 cpu_pool: Optional[Executor] = None,
+                 use_cache: bool = False,
+                 retry_config: Optional[RetryConfig] = None):
         self.site = site
-        self.session = HTTPSession(
+        self.on_page_crawled = on_page_crawled
+        
+        # Transient failures are retried up to three times before a page fails
+        self.retry_config = retry_config or RetryConfig(max_attempts=4, base_delay=1.0, max_delay=10.0)
+        
+        # Keep pages with ETag/Last-Modified in the file cache and revalidate
+        # them with conditional GETs on later crawls
+        self.use_cache = use_cache
+        
+        # Parsing is CPU-bound; with a process pool it runs beside the downloads
+        self.cpu_pool = cpu_pool
+        
+        # Converting the pydantic URL is not free, so do it once per crawl
+        self._base_url_str = str(site.base_url)
+        self._base_netloc = get_domain(self._base_url_str)
+        
+        # One pooled aiohttp session is shared by every request of the crawl
+        self.session = AsyncHTTPSession(
             rate_limit_delay=site.config.rate_limit_delay,
             timeout=site.config.timeout,
+            concurrent_limit=site.config.concurrent_requests,
             user_agent=site.config.user_agent
         )
-        self.robots_checker = RobotsChecker(str(site.base_url))
+        self.robots_checker = RobotsChecker(self._base_url_str)
         self.discovered_urls: Set[str] = set()
         self.crawled_urls: Set[str] = set()
         
-        # Performance optimization
-        self.processor = ConcurrentProcessor(
-            max_workers=min(site.config.max_concurrent_requests, 10),
-            use_process_pool=False
-        )
+        # Pages waiting for a crawl worker, while a crawl is running
+        self._crawl_queue: Optional[asyncio.Queue] = None
+        
+        # Content shingle hashes of each crawled page, for near-duplicate checks
+        self._page_shingles: List[Set[int]] = []
         
     async def crawl_site(self) -> Site:
         """Crawl the entire site starting from base URL."""
-        async with performance_context(enable_monitoring=True) as ctx:
-            try:
-                # Load robots.txt if respecting it
-                if self.site.config.respect_robots_txt:
-                    robots_loaded = self.robots_checker.load_robots_txt()
-                    if robots_loaded:
-                        # Update rate limit based on robots.txt
-                        crawl_delay = self.robots_checker.get_crawl_delay()
-                        if crawl_delay and crawl_delay > self.site.config.rate_limit_delay:
-                            self.site.config.rate_limit_delay = crawl_delay
-                            self.session.rate_limiter.delay = crawl_delay
-                
-                # Discover initial URLs
-                await self._discover_initial_urls()
-                
-                # Crawl pages level by level with performance optimization
-                await self._crawl_by_depth_optimized()
-                
-                return self.site
-                
-            finally:
-                self.session.close()
+        async with performance_context(enable_monitoring=True) as ctx, self.session:
+            # Load robots.txt if respecting it
+            if self.site.config.respect_robots_txt:
+                robots_loaded = self.robots_checker.load_robots_txt()
+                if robots_loaded:
+                    # Update rate limit based on robots.txt
+                    crawl_delay = self.robots_checker.get_crawl_delay()
+                    if crawl_delay and crawl_delay > self.site.config.rate_limit_delay:
+                        self.site.config.rate_limit_delay = crawl_delay
+                        self.session.rate_limiter.set_rate(1 / crawl_delay, burst=1)
+            
+            # Discover initial URLs
+            await self._discover_initial_urls()
+            
+            # Crawl pages breadth-first with a pool of workers
+            await self._crawl_by_depth()
+            
+            return self.site
     
     async def _discover_initial_urls(self):
         """Discover initial URLs from sitemaps and base URL."""
         # Add base URL
-        self._add_discovered_url(str(self.site.base_url), depth=0)
+        self._add_discovered_url(self._base_url_str, depth=0)
         
         # Try to find sitemaps
         sitemap_urls = await self._discover_sitemaps()
-        for sitemap_url in sitemap_urls:
-            await self._parse_sitemap(sitemap_url)
+        await self._parse_sitemaps(sitemap_urls)
+    
+    async def _parse_sitemaps(self, sitemap_urls: List[str]):
+        """Parse sitemaps and the sitemaps they nest, one level at a time.
+        
+        Every sitemap of a level is fetched concurrently. Each sitemap is parsed
+        at most once, and at most _MAX_SITEMAPS are parsed in total.
+        """
+        seen: Set[str] = set()
+        pending = sitemap_urls
+        
+        while pending and len(seen) < _MAX_SITEMAPS:
+            batch = [url for url in dict.fromkeys(pending) if url not in seen]
+            batch = batch[:_MAX_SITEMAPS - len(seen)]
+            seen.update(batch)
+            
+            results = await asyncio.gather(*(self._parse_sitemap(url) for url in batch))
+            pending = [nested for nested_sitemaps in results for nested in nested_sitemaps]
     
     async def _discover_sitemaps(self) -> List[str]:
         """Discover sitemap URLs."""
@@ -91,43 +316,67 @@ class StaticCrawler:
         ]
         
         for location in common_locations:
-            sitemap_url = urljoin(str(self.site.base_url), location)
+            sitemap_url = urljoin(self._base_url_str, location)
             if sitemap_url not in sitemaps:
                 sitemaps.append(sitemap_url)
         
         return sitemaps
     
-    async def _parse_sitemap(self, sitemap_url: str):
-        """Parse an XML sitemap and extract URLs."""
+    async def _parse_sitemap(self, sitemap_url: str) -> List[str]:
+        """Parse an XML sitemap, extract URLs and return any nested sitemap URLs.
+        
+        The response is fed to an incremental XML parser chunk by chunk, so large
+        sitemaps are never held in memory as a whole.
+        """
         try:
-            response = await self.session.get(sitemap_url)
-            if response.status_code == 200:
-                self.site.sitemap_urls.append(HttpUrl(sitemap_url))
-                
-                # Parse XML
-                root = ET.fromstring(response.content)
-                
-                # Handle namespace
-                namespaces = {
-                    'sitemap': 'http://www.sitemaps.org/schemas/sitemap/0.9'
-                }
+            nested_sitemaps = []
+            
+            async with self.session.get(sitemap_url) as response:
+                if response.status != 200:
+                    return []
                 
-                # Look for URL elements
-                for url_elem in root.findall('.//sitemap:url/sitemap:loc', namespaces):
-                    if url_elem.text:
-                        self._add_discovered_url(url_elem.text, depth=1)
+                self.site.sitemap_urls.append(HttpUrl(sitemap_url))
                 
-                # Look for nested sitemaps
-                for sitemap_elem in root.findall('.//sitemap:sitemap/sitemap:loc', namespaces):
-                    if sitemap_elem.text:
-                        await self._parse_sitemap(sitemap_elem.text)
-                        
+                parser = ET.XMLPullParser(events=('start', 'end'))
+                open_elems = []
+                async for chunk in response.content.iter_chunked(_SITEMAP_CHUNK_SIZE):
+                    parser.feed(chunk)
+                    self._read_sitemap_locs(parser, open_elems, nested_sitemaps)
+                parser.close()
+                self._read_sitemap_locs(parser, open_elems, nested_sitemaps)
+            
+            return nested_sitemaps
+            
         except Exception as e:
             self.site.add_warning(f"Failed to parse sitemap {sitemap_url}: {e}")
+            return []
+    
+    def _read_sitemap_locs(self, parser: ET.XMLPullParser, open_elems: List[ET.Element],
+                           nested_sitemaps: List[str]):
+        """Discover page URLs from pending parser events and collect nested sitemap URLs.
+        
+        ``open_elems`` is the stack of currently open elements and carries over
+        between calls, as one element may span several fed chunks.
+        """
+        for event, elem in parser.read_events():
+            if event == 'start':
+                open_elems.append(elem)
+                continue
+            
+            open_elems.pop()
+            if elem.tag == _SITEMAP_LOC and elem.text and open_elems:
+                # <loc> inside <url> is a page, inside <sitemap> a nested sitemap
+                if open_elems[-1].tag == _SITEMAP_URL:
+                    self._add_discovered_url(elem.text.strip(), depth=1)
+                elif open_elems[-1].tag == _SITEMAP_SITEMAP:
+                    nested_sitemaps.append(elem.text.strip())
+            elif elem.tag in (_SITEMAP_URL, _SITEMAP_SITEMAP) and open_elems:
+                # Drop finished entries from the root so memory stays flat
+                open_elems[0].clear()
     
     def _add_discovered_url(self, url: str, depth: int = 0, parent_url: Optional[str] = None):
         """Add a discovered URL to the crawl queue."""
-        normalized_url = normalize_url(url)
+        normalized_url = sys.intern(normalize_url(url))
         
         # Skip if already discovered
         if normalized_url in self.discovered_urls:
@@ -138,245 +387,293 @@ class StaticCrawler:
             return
         
         # Check domain
-        if not is_same_domain(normalized_url, str(self.site.base_url)):
+        if get_domain(normalized_url) != self._base_netloc:
             return
         
-        # Check depth limit
-        if depth > self.site.config.max_depth:
-            return
+        self._enqueue_urls([normalized_url], depth, parent_url)
+    
+    def _enqueue_urls(self, urls: List[str], depth: int, parent_url: Optional[str] = None):
+        """Add normalized, valid same-domain URLs found together to the crawl queue.
         
-        # Check page limit
-        if len(self.discovered_urls) >= self.site.config.max_pages:
-            return
+        Depth, page limit and robots.txt are checked here; callers must have
+        normalized and validated the URLs already.
+        """
+        config = self.site.config
         
-        # Check robots.txt
-        if self.site.config.respect_robots_txt and not self.robots_checker.can_fetch(normalized_url):
+        # Check depth limit
+        if depth > config.max_depth:
             return
         
-        # Add to discovered URLs
-        self.discovered_urls.add(normalized_url)
+        respect_robots_txt = config.respect_robots_txt
+        can_fetch = self.robots_checker.can_fetch
+        parent = HttpUrl(parent_url) if parent_url else None
         
-        # Create page object
-        page = Page(
-            url=HttpUrl(normalized_url),
-            depth=depth,
-            parent_url=HttpUrl(parent_url) if parent_url else None,
-        )
-        
-        self.site.add_page(page)
-    
-    async def _crawl_by_depth(self):
-        """Crawl pages level by level to respect depth limits."""
-        for depth in range(self.site.config.max_depth + 1):
-            pages_at_depth = self.site.get_pages_by_depth(depth)
-            uncrawled_pages = [p for p in pages_at_depth if p.status == CrawlStatus.PENDING]
+        for url in urls:
+            if url in self.discovered_urls:
+                continue
             
-            if not uncrawled_pages:
+            # Check page limit
+            if len(self.discovered_urls) >= config.max_pages:
+                return
+            
+            # Check robots.txt
+            if respect_robots_txt and not can_fetch(url):
                 continue
             
-            # Crawl pages at this depth
-            for page in uncrawled_pages:
-                if len(self.crawled_urls) >= self.site.config.max_pages:
-                    break
-                
-                await self._crawl_page(page)
+            # Add to discovered URLs
+            self.discovered_urls.add(url)
+            
+            # Create page object
+            page = Page(
+                url=HttpUrl(url),
+                depth=depth,
+                parent_url=parent,
+            )
+            
+            self.site.add_page(page)
+            
+            # Queue it straight away when a crawl is running
+            if self._crawl_queue is not None:
+                self._crawl_queue.put_nowait(page)
+    
+    async def _crawl_by_depth(self):
+        """Crawl pages breadth-first, starting each one as soon as a worker is free.
+        
+        Pages discovered during the crawl are queued directly, so a slow page no
+        longer holds back the whole next depth level.
+        """
+        self._crawl_queue = asyncio.Queue()
+        for page in sorted(self.site.get_uncrawled_pages(), key=lambda p: p.depth):
+            self._crawl_queue.put_nowait(page)
+        
+        # One worker per allowed in-flight request keeps the session saturated
+        workers = [
+            asyncio.ensure_future(self._crawl_worker())
+            for _ in range(self.site.config.concurrent_requests)
+        ]
+        
+        try:
+            await self._crawl_queue.join()
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+            self._crawl_queue = None
+    
+    async def _crawl_worker(self):
+        """Crawl queued pages until cancelled."""
+        while True:
+            page = await self._crawl_queue.get()
+            try:
+                if len(self.crawled_urls) < self.site.config.max_pages:
+                    await self._crawl_page(page)
+            finally:
+                self._crawl_queue.task_done()
     
     async def _crawl_page(self, page: Page):
         """Crawl a single page."""
-        url = str(page.url)
+        url = page.url_str
         
         if url in self.crawled_urls:
             return
         
         try:
             page.status = CrawlStatus.CRAWLING
-            response = await self.session.get(url)
             
-            # Update page with response info
-            page.mark_crawled(response.status_code, response.headers.get('content-type'))
+            # Revalidate a page stored by an earlier crawl instead of refetching it
+            cache_key = (
+                f"conditional_get:{url}:{self.site.config.include_assets}"
+                if self.use_cache else None
+            )
+            cached_page = await file_cache.get(cache_key) if cache_key else None
+            not_modified = False
+            
+            async with self._get_with_retry(url, headers=_conditional_headers(cached_page)) as response:
+                content_type = response.headers.get('content-type')
+                
+                if response.status == 304 and cached_page is not None:
+                    # Unchanged since the cached crawl; its body and extraction still hold
+                    not_modified = True
+                    page.mark_crawled(cached_page['status_code'], cached_page['content_type'])
+                    html = cached_page['html']
+                else:
+                    # Update page with response info
+                    page.mark_crawled(response.status, content_type)
+                    
+                    if not page.is_successful:
+                        page.add_error(f"HTTP {response.status}")
+                        return
+                    
+                    # Don't download or decode bodies that are not HTML
+                    if content_type and 'html' not in content_type.lower():
+                        page.status = CrawlStatus.SKIPPED
+                        page.add_warning(f"Skipped non-HTML content ({content_type})")
+                        self.crawled_urls.add(url)
+                        return
+                    
+                    body = await self._read_capped_body(page, response)
+                    html = body.decode(response.charset or 'utf-8', errors='replace')
+                    etag = response.headers.get('etag')
+                    last_modified = response.headers.get('last-modified')
             
-            if not page.is_successful:
-                page.add_error(f"HTTP {response.status_code}")
+            # Skip pages whose text was already crawled (pagination, facets)
+            if self.site.config.skip_near_duplicates and self._is_near_duplicate(html):
+                page.status = CrawlStatus.SKIPPED
+                page.add_warning("Skipped near-duplicate content")
+                self.crawled_urls.add(url)
                 return
             
             # Store HTML content
-            page.html_content = response.text
-            page.content_length = len(response.text)
-            
-            # Parse HTML
-            soup = BeautifulSoup(response.text, 'html.parser')
-            
-            # Extract basic page info
-            self._extract_basic_info(page, soup)
+            page.html_content = html
+            page.content_length = len(html)
             
-            # Extract links for further crawling
-            self._extract_links(page, soup)
-            
-            # Extract assets
-            self._extract_assets(page, soup)
+            if html.strip():
+                # Extract basic info, links for further crawling and assets
+                if not_modified:
+                    data = cached_page['data']
+                else:
+                    data = await self._extract_page_data(html, url)
+                    
+                    # Only responses the server can revalidate are worth keeping
+                    if cache_key and (etag or last_modified):
+                        await file_cache.set(cache_key, {
+                            'etag': etag,
+                            'last_modified': last_modified,
+                            'status_code': page.status_code,
+                            'content_type': page.content_type,
+                            'html': html,
+                            'data': data,
+                        })
+                
+                self._apply_page_data(page, data)
             
             self.crawled_urls.add(url)
             
+            # Hand the finished page to any downstream consumer
+            if self.on_page_crawled:
+                self.on_page_crawled(page)
+            
         except Exception as e:
             page.status = CrawlStatus.FAILED
             page.add_error(f"Crawl failed: {e}")
     
-    def _extract_basic_info(self, page: Page, soup: BeautifulSoup):
-        """Extract basic page information."""
-        # Title
-        title_tag = soup.find('title')
-        if title_tag:
-            page.title = title_tag.get_text().strip()
-        
-        # Meta description
-        meta_desc = soup.find('meta', attrs={'name': 'description'})
-        if meta_desc and meta_desc.get('content'):
-            page.seo.description = meta_desc['content']
-        
-        # Meta keywords
-        meta_keywords = soup.find('meta', attrs={'name': 'keywords'})
-        if meta_keywords and meta_keywords.get('content'):
-            page.seo.keywords = [k.strip() for k in meta_keywords['content'].split(',')]
-        
-        # Open Graph
-        og_title = soup.find('meta', property='og:title')
-        if og_title and og_title.get('content'):
-            page.seo.og_title = og_title['content']
-        
-        og_desc = soup.find('meta', property='og:description')
-        if og_desc and og_desc.get('content'):
-            page.seo.og_description = og_desc['content']
-        
-        og_image = soup.find('meta', property='og:image')
-        if og_image and og_image.get('content'):
-            page.seo.og_image = og_image['content']
-        
-        # Canonical URL
-        canonical = soup.find('link', rel='canonical')
-        if canonical and canonical.get('href'):
-            try:
-                page.seo.canonical_url = HttpUrl(canonical['href'])
-            except Exception:
-                pass
-    
-    def _extract_links(self, page: Page, soup: BeautifulSoup):
-        """Extract links from the page."""
-        links = soup.find_all('a', href=True)
-        
-        for link in links:
-            href = link['href']
-            absolute_url = resolve_url(str(page.url), href)
-            normalized_url = normalize_url(absolute_url)
-            
-            if not is_valid_url(normalized_url):
-                continue
-            
-            if is_same_domain(normalized_url, str(self.site.base_url)):
-                page.add_internal_link(HttpUrl(normalized_url))
-                
-                # Add to crawl queue if not already discovered
-                if normalized_url not in self.discovered_urls:
-                    self._add_discovered_url(
-                        normalized_url, 
-                        depth=page.depth + 1,
-                        parent_url=str(page.url)
-                    )
-            else:
-                page.add_external_link(HttpUrl(normalized_url))
-    
-    def _extract_assets(self, page: Page, soup: BeautifulSoup):
-        """Extract asset information from the page."""
-        # Images
-        images = soup.find_all('img', src=True)
-        for img in images:
-            src = img['src']
-            absolute_url = resolve_url(str(page.url), src)
-            
-            asset = AssetInfo(
-                url=absolute_url,
-                type="image",
-                alt_text=img.get('alt', ''),
-            )
+    @asynccontextmanager
+    async def _get_with_retry(self, url: str, **kwargs):
+        """Open a GET request, retrying connection errors and 429/5xx responses.
+        
+        Retries wait with jittered exponential backoff, or as long as allowed
+        when the server is rate limiting. The last attempt's response is
+        yielded whatever its status.
+        """
+        attempts = self.retry_config.max_attempts
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
             
-            # Try to extract dimensions
-            width = img.get('width')
-            height = img.get('height')
-            if width and height:
+            async with AsyncExitStack() as stack:
                 try:
-                    asset.dimensions = (int(width), int(height))
-                except ValueError:
-                    pass
-            
-            page.add_asset(asset)
-        
-        # CSS files
-        css_links = soup.find_all('link', rel='stylesheet', href=True)
-        for css_link in css_links:
-            href = css_link['href']
-            absolute_url = resolve_url(str(page.url), href)
+                    response = await stack.enter_async_context(self.session.get(url, **kwargs))
+                except (aiohttp.ClientError, asyncio.TimeoutError):
+                    if last_attempt:
+                        raise
+                    category = ErrorCategory.NETWORK
+                else:
+                    if last_attempt or response.status not in _RETRY_STATUSES:
+                        yield response
+                        return
+                    category = (
+                        ErrorCategory.RATE_LIMIT if response.status == 429 else ErrorCategory.NETWORK
+                    )
             
-            asset = AssetInfo(
-                url=absolute_url,
-                type="css",
-            )
-            page.add_asset(asset)
+            await asyncio.sleep(calculate_delay(attempt, self.retry_config, category))
+    
+    async def _extract_page_data(self, html: str, page_url: str) -> Dict[str, Any]:
+        """Run extract_page_data in the process pool when one was given, else inline."""
+        include_assets = self.site.config.include_assets
+        if self.cpu_pool is None:
+            return extract_page_data(html, page_url, self._base_netloc, include_assets)
         
-        # JavaScript files
-        js_scripts = soup.find_all('script', src=True)
-        for script in js_scripts:
-            src = script['src']
-            absolute_url = resolve_url(str(page.url), src)
-            
-            asset = AssetInfo(
-                url=absolute_url,
-                type="javascript",
-            )
-            page.add_asset(asset)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self.cpu_pool, extract_page_data, html, page_url, self._base_netloc, include_assets
+        )
     
-    async def _crawl_by_depth_optimized(self):
-        """Optimized crawling with concurrent processing."""
-        current_depth = 0
-        
-        while current_depth <= self.site.config.max_depth:
-            # Get URLs for current depth
-            urls_to_crawl = [
-                url for url in self.discovered_urls 
-                if url not in self.crawled_urls 
-                and self.site.has_page(url)
-                and self.site.get_page(url).depth == current_depth
-            ]
-            
-            if not urls_to_crawl:
+    async def _read_capped_body(self, page: Page, response) -> bytes:
+        """Stream a response body, stopping at the configured size cap."""
+        max_bytes = self.site.config.max_html_bytes
+        body = bytearray()
+        
+        async for chunk in response.content.iter_chunked(_BODY_CHUNK_SIZE):
+            body += chunk
+            if len(body) >= max_bytes:
+                page.add_warning(f"HTML truncated at {max_bytes} bytes")
+                del body[max_bytes:]
                 break
-            
-            # Process pages concurrently
-            pages_to_process = [self.site.get_page(url) for url in urls_to_crawl]
-            
-            await self.processor.process_batch(
-                pages_to_process,
-                self._crawl_page,
-                batch_size=5,  # Process in smaller batches to manage memory
-                progress_callback=self._update_crawl_progress
-            )
-            
-            current_depth += 1
+        
+        return bytes(body)
     
-    def _update_crawl_progress(self, completed: int, total: int):
-        """Update crawl progress for monitoring."""
-        progress = (completed / total) * 100 if total > 0 else 0
-        self.site.statistics.crawl_progress = progress
+    def _is_near_duplicate(self, html: str) -> bool:
+        """Check whether a page's visible text mostly repeats one crawled page.
+        
+        The page is compared with each crawled page on its own, not with all of
+        them together, so header, nav and footer text shared across a site
+        can't add up to a match. Pages that are not duplicates are recorded
+        for later pages to be compared against.
+        """
+        text = _TAG_RE.sub(' ', _INVISIBLE_BLOCK_RE.sub(' ', html))
+        words = _WORD_RE.findall(text.lower())
+        
+        # Too little text to judge
+        if len(words) < _SHINGLE_SIZE:
+            return False
+        
+        shingles = {
+            hash(tuple(words[i:i + _SHINGLE_SIZE]))
+            for i in range(len(words) - _SHINGLE_SIZE + 1)
+        }
+        for crawled in self._page_shingles:
+            shared = len(shingles & crawled)
+            if shared >= _DUPLICATE_THRESHOLD * (len(shingles) + len(crawled) - shared):
+                return True
+        
+        self._page_shingles.append(shingles)
+        return False
     
-    @cached(ttl=3600, key_func=lambda self, url: f"page_content:{url}")
-    async def _get_cached_page_content(self, url: str) -> Optional[Dict]:
-        """Get page content with caching."""
-        try:
-            response = await self.session.get(url)
-            if response.status_code == 200:
-                return {
-                    "content": response.text,
-                    "headers": dict(response.headers),
-                    "status_code": response.status_code
-                }
-        except Exception:
-            pass
-        return None
\ No newline at end of file
+    def _apply_page_data(self, page: Page, data: Dict[str, Any]):
+        """Attach data from extract_page_data to the page and queue its new links.
+        
+        URLs are interned here, on the crawler's side of any process boundary, as
+        nav links, stylesheets, scripts and logos repeat on most pages of a site.
+        """
+        # Basic page info
+        if data['title'] is not None:
+            page.title = data['title']
+        
+        for field, value in data['seo'].items():
+            if field == 'canonical_url':
+                try:
+                    value = HttpUrl(value)
+                except Exception:
+                    continue
+            setattr(page.seo, field, value)
+        
+        # Links; once max_pages URLs are discovered none can be queued, so
+        # they are only recorded on the page
+        queue_links = len(self.discovered_urls) < self.site.config.max_pages
+        new_urls = []
+        for url in data['internal_links']:
+            url = sys.intern(url)
+            page.add_internal_link(http_url(url))
+            if queue_links and url not in self.discovered_urls:
+                new_urls.append(url)
+        
+        for url in data['external_links']:
+            page.add_external_link(http_url(sys.intern(url)))
+        
+        # Add the page's undiscovered links to the crawl queue in one go
+        if new_urls:
+            self._enqueue_urls(new_urls, depth=page.depth + 1, parent_url=page.url_str)
+        
+        # Assets
+        for asset in data['assets']:
+            asset['url'] = sys.intern(asset['url'])
+            page.add_asset(AssetInfo(**asset))
@@ -3,20 +3,49 @@
 import re
 import json
 from typing import Dict, List, Optional, Set, Any, Tuple
-from urllib.parse import urljoin, urlparse
+from urllib.parse import urljoin, urlparse, urlsplit, urlunsplit
 from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 import requests
+from requests.adapters import HTTPAdapter
 
 from ..models.page import Page
 from ..models.site import Site
 
 
+# Upper bound on concurrent HEAD probes, which is also the connection pool size
+_MAX_PROBE_WORKERS = 32
+
+# Ports dropped from endpoint URLs when they are the scheme's default
+_DEFAULT_PORTS = {'http': ':80', 'https': ':443'}
+
+
 class APIDiscovery:
     """Discover and analyze API endpoints from web pages."""
     
-    def __init__(self):
+    # fetch(), XMLHttpRequest, axios and jQuery calls as one alternation, so each
+    # inline script is scanned once. The URL group is always the last one matched,
+    # which lets match.lastgroup say which kind of call was found.
+    _JS_REQUEST_RE = re.compile(
+        r'fetch\s*\(\s*[\'"`](?P<fetch>[^\'"`]+)[\'"`]'
+        r'|\.open\s*\(\s*[\'"`](?P<xhr_method>\w+)[\'"`]\s*,\s*[\'"`](?P<xhr>[^\'"`]+)[\'"`]'
+        r'|axios\s*\.\s*(?P<axios_method>\w+)\s*\(\s*[\'"`](?P<axios>[^\'"`]+)[\'"`]'
+        r'|\$\.(?:get|post|ajax)\s*\(\s*[\'"`](?P<jquery>[^\'"`]+)[\'"`]',
+        re.IGNORECASE
+    )
+    
+    # Kind of call -> (endpoint source, method group or None for GET)
+    _JS_REQUEST_KINDS = {
+        'fetch': ('javascript_fetch', None),
+        'xhr': ('javascript_xhr', 'xhr_method'),
+        'axios': ('javascript_axios', 'axios_method'),
+        'jquery': ('javascript_jquery', None),
+    }
+    
+    def __init__(self, parser: str = 'html.parser'):
+        self.parser = parser
         self.api_patterns = [
             # REST API patterns
             r'/api/v?\d*/[\w/-]+',
@@ -43,6 +72,15 @@ class APIDiscovery:
             r'/atom\.xml',
         ]
         
+        # Union of the patterns above plus a keyword fallback, compiled once since
+        # every candidate URL on every page is checked against them
+        self._api_regex = re.compile(
+            "|".join(f"(?:{pattern})" for pattern in self.api_patterns), re.IGNORECASE
+        )
+        self._keyword_regex = re.compile(
+            r'api|rest|graphql|json|xml|ajax|data|service', re.IGNORECASE
+        )
+        
         # Common API response indicators
         self.api_indicators = [
             'application/json',
@@ -57,6 +95,12 @@ class APIDiscovery:
         # HTTP methods to test
         self.http_methods = ['GET', 'POST', 'PUT', 'DELETE', 'PATCH', 'OPTIONS']
         
+        # Shared by all probes so connections to the site are kept alive and reused
+        self.session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=_MAX_PROBE_WORKERS, pool_maxsize=_MAX_PROBE_WORKERS)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        
     def discover_apis(self, site: Site) -> Site:
         """Discover API endpoints across all pages in the site."""
         discovered_endpoints = set()
@@ -93,11 +137,11 @@ class APIDiscovery:
         if not page.html_content:
             return endpoints
         
-        # Parse HTML content
-        soup = BeautifulSoup(page.html_content, 'html.parser')
+        # Parse HTML content once for all extractors
+        soup = BeautifulSoup(page.html_content, self.parser)
         
         # Extract from JavaScript code
-        js_endpoints = self._extract_from_javascript(page.html_content, str(page.url))
+        js_endpoints = self._extract_from_javascript(soup, str(page.url))
         endpoints.update(js_endpoints)
         
         # Extract from data attributes
@@ -119,67 +163,27 @@ class APIDiscovery:
         
         return endpoints
     
-    def _extract_from_javascript(self, html_content: str, page_url: str) -> Dict[str, Dict[str, Any]]:
+    def _extract_from_javascript(self, soup: BeautifulSoup, page_url: str) -> Dict[str, Dict[str, Any]]:
         """Extract API endpoints from JavaScript code."""
         endpoints = {}
         
         # Find script tags
-        soup = BeautifulSoup(html_content, 'html.parser')
         scripts = soup.find_all('script')
         
         for script in scripts:
             if script.string:
                 js_content = script.string
                 
-                # Look for fetch() calls
-                fetch_pattern = r'fetch\s*\(\s*[\'"`]([^\'"`]+)[\'"`]'
-                fetch_matches = re.findall(fetch_pattern, js_content, re.IGNORECASE)
-                
-                for match in fetch_matches:
-                    endpoint = self._resolve_endpoint(match, page_url)
-                    if self._is_api_endpoint(endpoint):
-                        endpoints[endpoint] = {
-                            'source': 'javascript_fetch',
-                            'method': 'GET',
-                            'page_url': page_url
-                        }
-                
-                # Look for XMLHttpRequest calls
-                xhr_pattern = r'\.open\s*\(\s*[\'"`](\w+)[\'"`]\s*,\s*[\'"`]([^\'"`]+)[\'"`]'
-                xhr_matches = re.findall(xhr_pattern, js_content, re.IGNORECASE)
-                
-                for method, url in xhr_matches:
-                    endpoint = self._resolve_endpoint(url, page_url)
-                    if self._is_api_endpoint(endpoint):
-                        endpoints[endpoint] = {
-                            'source': 'javascript_xhr',
-                            'method': method.upper(),
-                            'page_url': page_url
-                        }
-                
-                # Look for axios calls
-                axios_pattern = r'axios\s*\.\s*(\w+)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]'
-                axios_matches = re.findall(axios_pattern, js_content, re.IGNORECASE)
-                
-                for method, url in axios_matches:
-                    endpoint = self._resolve_endpoint(url, page_url)
+                # Look for fetch(), XMLHttpRequest, axios and jQuery AJAX calls
+                for match in self._JS_REQUEST_RE.finditer(js_content):
+                    kind = match.lastgroup
+                    source, method_group = self._JS_REQUEST_KINDS[kind]
+                    
+                    endpoint = self._resolve_endpoint(match.group(kind), page_url)
                     if self._is_api_endpoint(endpoint):
                         endpoints[endpoint] = {
-                            'source': 'javascript_axios',
-                            'method': method.upper(),
-                            'page_url': page_url
-                        }
-                
-                # Look for jQuery AJAX calls
-                jquery_pattern = r'\$\.(?:get|post|ajax)\s*\(\s*[\'"`]([^\'"`]+)[\'"`]'
-                jquery_matches = re.findall(jquery_pattern, js_content, re.IGNORECASE)
-                
-                for match in jquery_matches:
-                    endpoint = self._resolve_endpoint(match, page_url)
-                    if self._is_api_endpoint(endpoint):
-                        endpoints[endpoint] = {
-                            'source': 'javascript_jquery',
-                            'method': 'GET',
+                            'source': source,
+                            'method': match.group(method_group).upper() if method_group else 'GET',
                             'page_url': page_url
                         }
         
@@ -192,11 +196,14 @@ class APIDiscovery:
         # Look for data-url, data-api, data-endpoint attributes
         data_attrs = ['data-url', 'data-api', 'data-endpoint', 'data-src', 'data-action']
         
-        for attr in data_attrs:
-            elements = soup.find_all(attrs={attr: True})
+        # One walk over the tree, checking every attribute on each element
+        for element in soup.descendants:
+            if not isinstance(element, Tag) or not element.attrs:
+                continue
             
-            for element in elements:
-                url = element.get(attr)
+            attrs = element.attrs
+            for attr in data_attrs:
+                url = attrs.get(attr)
                 if url:
                     endpoint = self._resolve_endpoint(url, page_url)
                     if self._is_api_endpoint(endpoint):
@@ -252,51 +259,74 @@ class APIDiscovery:
             '/sw.js'
         ]
         
-        for path in common_paths:
-            endpoint = urljoin(base_url, path)
+        candidates = [urljoin(base_url, path) for path in common_paths]
+        
+        # Probes are independent and network-bound, so send them all at once
+        with ThreadPoolExecutor(max_workers=min(len(candidates), _MAX_PROBE_WORKERS)) as executor:
+            results = executor.map(self._probe_common_endpoint, candidates)
             
-            # Test if endpoint exists
-            try:
-                response = requests.head(endpoint, timeout=5, allow_redirects=True)
-                if response.status_code < 400:
-                    endpoints[endpoint] = {
-                        'source': 'common_path_discovery',
-                        'method': 'GET',
-                        'status_code': response.status_code,
-                        'content_type': response.headers.get('content-type', ''),
-                        'exists': True
-                    }
-            except Exception:
-                # Endpoint doesn't exist or is unreachable
-                pass
+            for endpoint, info in zip(candidates, results):
+                if info:
+                    endpoints[endpoint] = info
         
         return endpoints
     
+    def _probe_common_endpoint(self, endpoint: str) -> Optional[Dict[str, Any]]:
+        """Test if a common endpoint exists, returning its metadata or None."""
+        try:
+            response = self.session.head(endpoint, timeout=5, allow_redirects=True)
+        except Exception:
+            # Endpoint doesn't exist or is unreachable
+            return None
+        
+        if response.status_code >= 400:
+            return None
+        
+        return {
+            'source': 'common_path_discovery',
+            'method': 'GET',
+            'status_code': response.status_code,
+            'content_type': response.headers.get('content-type', ''),
+            'exists': True
+        }
+    
     def _analyze_endpoints(self, endpoints: Set[str], metadata: Dict[str, Dict], base_url: str) -> Dict[str, Dict[str, Any]]:
         """Analyze discovered endpoints for detailed information."""
         analyzed = {}
-        
-        for endpoint in endpoints:
+        to_test = []
+        
+        # Sorted so the metadata kept for equivalent URLs doesn't depend on set order
+        for endpoint in sorted(endpoints):
+            # Spellings of an already analyzed URL would only repeat its analysis and probe
+            url = self._canonicalize(endpoint)
+            if url in analyzed:
+                continue
+            
             analysis = metadata.get(endpoint, {})
             
             # Categorize endpoint
-            analysis['category'] = self._categorize_endpoint(endpoint)
+            analysis['category'] = self._categorize_endpoint(url)
             
             # Determine API type
-            analysis['api_type'] = self._determine_api_type(endpoint)
+            analysis['api_type'] = self._determine_api_type(url)
             
             # Check if it's internal or external
-            analysis['is_internal'] = self._is_internal_endpoint(endpoint, base_url)
+            analysis['is_internal'] = self._is_internal_endpoint(url, base_url)
             
             # Analyze endpoint structure
-            analysis['path_structure'] = self._analyze_path_structure(endpoint)
+            analysis['path_structure'] = self._analyze_path_structure(url)
             
             # Test endpoint if it's internal and safe
             if analysis['is_internal'] and analysis.get('method', 'GET') == 'GET':
-                test_result = self._test_endpoint(endpoint)
-                analysis.update(test_result)
+                to_test.append(url)
             
-            analyzed[endpoint] = analysis
+            analyzed[url] = analysis
+        
+        # Run all the tests as one concurrent batch
+        if to_test:
+            with ThreadPoolExecutor(max_workers=min(len(to_test), _MAX_PROBE_WORKERS)) as executor:
+                for endpoint, test_result in zip(to_test, executor.map(self._test_endpoint, to_test)):
+                    analyzed[endpoint].update(test_result)
         
         return analyzed
     
@@ -375,7 +405,7 @@ class APIDiscovery:
         }
         
         try:
-            response = requests.head(endpoint, timeout=5, allow_redirects=True)
+            response = self.session.head(endpoint, timeout=5, allow_redirects=True)
             test_result['tested'] = True
             test_result['status_code'] = response.status_code
             test_result['accessible'] = response.status_code < 400
@@ -408,18 +438,26 @@ class APIDiscovery:
         else:
             return urljoin(base_url, url)
     
+    def _canonicalize(self, url: str) -> str:
+        """Reduce equivalent spellings of an endpoint URL to a single form.
+        
+        Lowercases the scheme and host, drops default ports, fragments and
+        trailing slashes.
+        """
+        parts = urlsplit(url)
+        scheme = parts.scheme.lower()
+        netloc = parts.netloc.lower()
+        
+        default_port = _DEFAULT_PORTS.get(scheme)
+        if default_port and netloc.endswith(default_port):
+            netloc = netloc[:-len(default_port)]
+        
+        path = parts.path.rstrip('/') or '/'
+        return urlunsplit((scheme, netloc, path, parts.query, ''))
+    
     def _is_api_endpoint(self, url: str) -> bool:
         """Check if a URL looks like an API endpoint."""
-        url_lower = url.lower()
-        
-        # Check against patterns
-        for pattern in self.api_patterns:
-            if re.search(pattern, url_lower):
-                return True
-        
-        # Check for API indicators in the URL
-        api_keywords = ['api', 'rest', 'graphql', 'json', 'xml', 'ajax', 'data', 'service']
-        return any(keyword in url_lower for keyword in api_keywords)
+        return bool(self._api_regex.search(url) or self._keyword_regex.search(url))
     
     def _generate_api_documentation(self, endpoints: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
         """Generate API documentation from discovered endpoints."""
@@ -468,7 +506,10 @@ class APIDiscovery:
         return dict(documentation)
 
 
-def discover_site_apis(site: Site) -> Site:
+def discover_site_apis(site: Site, parser: str = 'html.parser') -> Site:
     """Entry point for API discovery across a site."""
-    api_discovery = APIDiscovery()
-    return api_discovery.discover_apis(site)
\ No newline at end of file
+    api_discovery = APIDiscovery(parser=parser)
+    try:
+        return api_discovery.discover_apis(site)
+    finally:
+        api_discovery.session.close()
\ No newline at end of file
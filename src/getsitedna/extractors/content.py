@@ -14,7 +14,8 @@ from ..processors.html_parser import HTMLParser
 class ContentExtractor:
     """Extract and analyze page content."""
     
-    def __init__(self):
+    def __init__(self, parser: str = 'html.parser'):
+        self.parser = parser
         self.stop_words = {
             'the', 'a', 'an', 'and', 'or', 'but', 'in', 'on', 'at', 'to', 'for', 'of', 'with',
             'by', 'from', 'up', 'about', 'into', 'through', 'during', 'before', 'after',
@@ -23,13 +24,23 @@ class ContentExtractor:
             'should', 'may', 'might', 'must', 'can', 'this', 'that', 'these', 'those'
         }
     
-    def extract_content(self, page: Page) -> Page:
-        """Extract all content from a page."""
+    def extract_content(self, page: Page, soup: Optional[BeautifulSoup] = None) -> Page:
+        """Extract all content from a page.
+        
+        A pre-parsed ``soup`` may be passed to avoid re-parsing the HTML. Scripts,
+        styles and comments are removed from it in place.
+        """
         if not page.html_content:
             page.add_warning("No HTML content available for content extraction")
             return page
         
-        parser = HTMLParser(page.html_content, str(page.url))
+        if soup is None:
+            soup = BeautifulSoup(page.html_content, self.parser)
+        
+        # Whole-document figures for content metrics, taken before noise removal
+        document_stats = self._collect_document_stats(soup)
+        
+        parser = HTMLParser(page.html_content, str(page.url), soup=soup)
         
         # Extract text content
         text_content = parser.extract_text_content()
@@ -56,7 +67,7 @@ class ContentExtractor:
         self._process_meta_information(page, meta_info)
         
         # Calculate content metrics
-        self._calculate_content_metrics(page, parser)
+        self._calculate_content_metrics(page, parser, document_stats)
         
         return page
     
@@ -241,7 +252,20 @@ class ContentExtractor:
             "robots": meta_info.get("robots", "")
         }
     
-    def _calculate_content_metrics(self, page: Page, parser: HTMLParser):
+    def _collect_document_stats(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Count elements and headings and collect raw text in a single pass."""
+        elements = soup.find_all()
+        tag_counts = Counter(element.name for element in elements)
+        
+        return {
+            "element_count": len(elements),
+            "h1_count": tag_counts['h1'],
+            "h2_count": tag_counts['h2'],
+            "h3_count": tag_counts['h3'],
+            "text": soup.get_text(),
+        }
+    
+    def _calculate_content_metrics(self, page: Page, parser: HTMLParser, document_stats: Dict[str, Any]):
         """Calculate content quality and readability metrics."""
         metrics = {}
         
@@ -254,8 +278,7 @@ class ContentExtractor:
         metrics["reading_time_minutes"] = reading_time
         
         # Content density (words per HTML element)
-        soup = BeautifulSoup(page.html_content, 'html.parser')
-        element_count = len(soup.find_all())
+        element_count = document_stats["element_count"]
         if element_count > 0:
             metrics["content_density"] = word_count / element_count
         
@@ -265,9 +288,9 @@ class ContentExtractor:
         
         # Calculate heading hierarchy score
         if page.html_content:
-            h1_count = len(soup.find_all('h1'))
-            h2_count = len(soup.find_all('h2'))
-            h3_count = len(soup.find_all('h3'))
+            h1_count = document_stats["h1_count"]
+            h2_count = document_stats["h2_count"]
+            h3_count = document_stats["h3_count"]
             
             # Good hierarchy: 1 h1, multiple h2s, some h3s
             hierarchy_score = 1.0
@@ -287,7 +310,7 @@ class ContentExtractor:
         
         # Content-to-code ratio
         if page.html_content:
-            content_length = len(parser._clean_text(soup.get_text()))
+            content_length = len(parser._clean_text(document_stats["text"]))
             html_length = len(page.html_content)
             if html_length > 0:
                 metrics["content_to_code_ratio"] = content_length / html_length
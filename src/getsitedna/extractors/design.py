@@ -16,7 +16,8 @@ from ..models.schemas import ColorInfo, FontInfo, DesignToken
 class DesignExtractor:
     """Extract and analyze design elements from web pages."""
     
-    def __init__(self):
+    def __init__(self, parser: str = 'html.parser'):
+        self.parser = parser
         # Suppress cssutils warnings
         cssutils.log.setLevel('ERROR')
         
@@ -43,13 +44,14 @@ class DesignExtractor:
             'script': ['brush', 'pacifico', 'dancing', 'great vibes']
         }
     
-    def extract_design(self, page: Page) -> Page:
-        """Extract design elements from a page."""
+    def extract_design(self, page: Page, soup: Optional[BeautifulSoup] = None) -> Page:
+        """Extract design elements from a page, reusing a pre-parsed soup if given."""
         if not page.html_content:
             page.add_warning("No HTML content available for design extraction")
             return page
         
-        soup = BeautifulSoup(page.html_content, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(page.html_content, self.parser)
         
         # Extract colors
         colors = self._extract_colors(soup, page)
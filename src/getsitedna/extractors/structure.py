@@ -13,7 +13,8 @@ from ..models.schemas import ComponentSpec, ComponentType
 class StructureExtractor:
     """Extract and analyze page structure and layout."""
     
-    def __init__(self):
+    def __init__(self, parser: str = 'html.parser'):
+        self.parser = parser
         self.component_patterns = {
             ComponentType.HEADER: [
                 r'header', r'top', r'banner', r'masthead', r'site-header'
@@ -47,13 +48,14 @@ class StructureExtractor:
             ]
         }
     
-    def extract_structure(self, page: Page) -> Page:
-        """Extract structural information from a page."""
+    def extract_structure(self, page: Page, soup: Optional[BeautifulSoup] = None) -> Page:
+        """Extract structural information from a page, reusing a pre-parsed soup if given."""
         if not page.html_content:
             page.add_warning("No HTML content available for structure extraction")
             return page
         
-        soup = BeautifulSoup(page.html_content, 'html.parser')
+        if soup is None:
+            soup = BeautifulSoup(page.html_content, self.parser)
         
         # Identify components
         components = self._identify_components(soup)
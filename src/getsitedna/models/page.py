@@ -1,6 +1,7 @@
 """Page data model for website analysis."""
 
 from datetime import datetime
+from functools import cached_property
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 from urllib.parse import urljoin, urlparse
@@ -87,15 +88,20 @@ class Page(BaseModel):
                 v = "https://" + v
         return v
     
+    @cached_property
+    def url_str(self) -> str:
+        """URL as a string, computed once per page."""
+        return str(self.url)
+    
     @property
     def domain(self) -> str:
         """Extract domain from URL."""
-        return urlparse(str(self.url)).netloc
+        return urlparse(self.url_str).netloc
     
     @property
     def path(self) -> str:
         """Extract path from URL."""
-        return urlparse(str(self.url)).path
+        return urlparse(self.url_str).path
     
     @property
     def is_crawled(self) -> bool:
@@ -32,6 +32,8 @@ class CrawlConfig(BaseModel):
     browser_engine: str = "chromium"
     user_agent: Optional[str] = None
     timeout: int = Field(default=30, ge=5)
+    max_html_bytes: int = Field(default=4 * 1024 * 1024, ge=1024)
+    skip_near_duplicates: bool = False
 
 
 class SiteStats(BaseModel):
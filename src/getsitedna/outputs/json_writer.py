@@ -32,10 +32,9 @@ class JSONWriter:
         self._write_json_file(site_file, site_data)
         output_files["site_data"] = site_file
         
-        # Pages data
+        # Pages data (streamed page by page; this is the largest file)
         pages_file = self.output_directory / "pages_data.json"
-        pages_data = self._prepare_pages_data(site)
-        self._write_json_file(pages_file, pages_data)
+        self._write_pages_data(pages_file, site)
         output_files["pages_data"] = pages_file
         
         # Validation report
@@ -140,45 +139,49 @@ class JSONWriter:
         }
         
         for url, page in site.pages.items():
-            pages_data["pages"][url] = {
-                "summary": page.get_summary(),
-                "basic_info": {
-                    "title": page.title,
-                    "status": page.status.value,
-                    "status_code": page.status_code,
-                    "depth": page.depth,
-                    "content_type": page.content_type,
-                    "content_length": page.content_length,
-                    "discovered_at": page.discovered_at.isoformat(),
-                    "crawled_at": page.crawled_at.isoformat() if page.crawled_at else None,
-                    "analyzed_at": page.analyzed_at.isoformat() if page.analyzed_at else None,
-                },
-                "seo": {
-                    "title": page.seo.title,
-                    "description": page.seo.description,
-                    "keywords": page.seo.keywords,
-                    "og_title": page.seo.og_title,
-                    "og_description": page.seo.og_description,
-                    "og_image": page.seo.og_image,
-                    "canonical_url": str(page.seo.canonical_url) if page.seo.canonical_url else None,
-                    "schema_markup": page.seo.schema_markup,
-                },
-                "links": {
-                    "internal_count": len(page.internal_links),
-                    "external_count": len(page.external_links),
-                    "children_count": len(page.children),
-                    "internal_links": [str(url) for url in page.internal_links],
-                    "external_links": [str(url) for url in page.external_links],
-                    "children": [str(url) for url in page.children],
-                    "parent_url": str(page.parent_url) if page.parent_url else None,
-                },
-                "assets_count": len(page.assets),
-                "errors": page.errors,
-                "warnings": page.warnings,
-            }
+            pages_data["pages"][url] = self._prepare_page_entry(page)
         
         return pages_data
     
+    def _prepare_page_entry(self, page: Page) -> Dict[str, Any]:
+        """Prepare a single page's entry in pages data."""
+        return {
+            "summary": page.get_summary(),
+            "basic_info": {
+                "title": page.title,
+                "status": page.status.value,
+                "status_code": page.status_code,
+                "depth": page.depth,
+                "content_type": page.content_type,
+                "content_length": page.content_length,
+                "discovered_at": page.discovered_at.isoformat(),
+                "crawled_at": page.crawled_at.isoformat() if page.crawled_at else None,
+                "analyzed_at": page.analyzed_at.isoformat() if page.analyzed_at else None,
+            },
+            "seo": {
+                "title": page.seo.title,
+                "description": page.seo.description,
+                "keywords": page.seo.keywords,
+                "og_title": page.seo.og_title,
+                "og_description": page.seo.og_description,
+                "og_image": page.seo.og_image,
+                "canonical_url": str(page.seo.canonical_url) if page.seo.canonical_url else None,
+                "schema_markup": page.seo.schema_markup,
+            },
+            "links": {
+                "internal_count": len(page.internal_links),
+                "external_count": len(page.external_links),
+                "children_count": len(page.children),
+                "internal_links": [str(url) for url in page.internal_links],
+                "external_links": [str(url) for url in page.external_links],
+                "children": [str(url) for url in page.children],
+                "parent_url": str(page.parent_url) if page.parent_url else None,
+            },
+            "assets_count": len(page.assets),
+            "errors": page.errors,
+            "warnings": page.warnings,
+        }
+    
     def _prepare_page_data(self, page: Page) -> Dict[str, Any]:
         """Prepare detailed page data for JSON output."""
         return {
@@ -378,8 +381,39 @@ class JSONWriter:
     
     def _write_json_file(self, file_path: Path, data: Dict[str, Any]):
         """Write data to JSON file with proper formatting."""
+        # Serialize in one call and write once, rather than streaming many small chunks
+        file_path.write_text(self._dumps(data), encoding='utf-8')
+    
+    def _write_pages_data(self, file_path: Path, site: Site):
+        """Write pages data one page entry at a time.
+        
+        Produces the same file as writing _prepare_pages_data(site), without holding
+        every page entry in memory at once.
+        """
+        header = self._dumps({
+            "total_pages": len(site.pages),
+            "successful_pages": len(site.crawled_pages),
+            "failed_pages": len(site.failed_pages),
+            "pages": {}
+        })
+        if not site.pages:
+            file_path.write_text(header, encoding='utf-8')
+            return
+        
+        # Splice the entries into the empty "pages" object, nested two levels deep
+        opening, closing = header.rsplit('{}', 1)
         with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(data, f, indent=2, ensure_ascii=False, default=str)
+            f.write(opening + '{')
+            separator = '\n'
+            for url, page in site.pages.items():
+                entry = self._dumps(self._prepare_page_entry(page)).replace('\n', '\n    ')
+                f.write(f"{separator}    {self._dumps(url)}: {entry}")
+                separator = ',\n'
+            f.write('\n  }' + closing)
+    
+    def _dumps(self, data: Any) -> str:
+        """Serialize data in the output JSON format."""
+        return json.dumps(data, indent=2, ensure_ascii=False, default=str)
     
     def _sanitize_filename(self, filename: str) -> str:
         """Sanitize filename for safe filesystem usage."""
@@ -10,10 +10,15 @@ from bs4 import BeautifulSoup, Tag, NavigableString, Comment
 class HTMLParser:
     """Advanced HTML parsing and analysis utilities."""
     
-    def __init__(self, html_content: str, base_url: str = ""):
+    def __init__(self,
+                 html_content: str,
+                 base_url: str = "",
+                 soup: Optional[BeautifulSoup] = None,
+                 parser: str = 'html.parser'):
         self.html_content = html_content
         self.base_url = base_url
-        self.soup = BeautifulSoup(html_content, 'html.parser')
+        # A pre-parsed soup is reused as-is; noise removal modifies it in place
+        self.soup = soup if soup is not None else BeautifulSoup(html_content, parser)
         self._remove_noise()
     
     def _remove_noise(self):
@@ -101,6 +101,15 @@ class PatternRecognizer:
             'portfolio_site': ['hero_section', 'image_gallery', 'contact_form'],
             'corporate_site': ['hero_section', 'feature_grid', 'social_proof', 'contact_form']
         }
+        
+        # Indicator regexes, compiled once and matched against each page's class and id values
+        self._indicator_regexes = {
+            indicator: re.compile(indicator, re.IGNORECASE)
+            for pattern_config in self.ux_patterns.values()
+            for indicator in pattern_config['indicators']
+        }
+        self._grid_regex = re.compile(r'grid|row|col', re.IGNORECASE)
+        self._quote_regex = re.compile('quote', re.IGNORECASE)
     
     def recognize_patterns(self, site: Site) -> Site:
         """Recognize UX patterns across all pages in the site."""
@@ -145,10 +154,11 @@ class PatternRecognizer:
             return {}
         
         soup = BeautifulSoup(page.html_content, 'html.parser')
+        page_index = self._index_page(soup)
         detected_patterns = {}
         
         for pattern_name, pattern_config in self.ux_patterns.items():
-            confidence, elements = self._detect_pattern(soup, pattern_config)
+            confidence, elements = self._detect_pattern(page_index, pattern_config)
             
             if confidence > 0.3:  # Threshold for pattern detection
                 detected_patterns[pattern_name] = {
@@ -159,7 +169,39 @@ class PatternRecognizer:
         
         return detected_patterns
     
-    def _detect_pattern(self, soup: BeautifulSoup, pattern_config: Dict) -> Tuple[float, List[str]]:
+    def _index_page(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """Collect tag names, class and id values and page text in one pass over the tree.
+        
+        Pattern checks scan these instead of re-walking the soup for every indicator.
+        """
+        tags = set()
+        classes = []
+        ids = []
+        has_submit_input = False
+        
+        for element in soup.find_all(True):
+            tags.add(element.name)
+            
+            class_value = element.get('class')
+            if class_value:
+                classes.append(' '.join(class_value) if isinstance(class_value, list) else class_value)
+            
+            element_id = element.get('id')
+            if element_id:
+                ids.append(element_id)
+            
+            if element.name == 'input' and element.get('type') == 'submit':
+                has_submit_input = True
+        
+        return {
+            'tags': tags,
+            'classes': classes,
+            'ids': ids,
+            'has_submit_input': has_submit_input,
+            'text': soup.get_text().lower(),
+        }
+    
+    def _detect_pattern(self, page_index: Dict[str, Any], pattern_config: Dict) -> Tuple[float, List[str]]:
         """Detect a specific pattern in the HTML."""
         indicators = pattern_config['indicators']
         expected_elements = pattern_config['elements']
@@ -170,17 +212,19 @@ class PatternRecognizer:
         # Check for class/id indicators
         indicator_score = 0
         for indicator in indicators:
+            regex = self._indicator_regexes[indicator]
+            
             # Check classes
-            class_matches = soup.find_all(class_=re.compile(indicator, re.IGNORECASE))
+            class_matches = sum(1 for value in page_index['classes'] if regex.search(value))
             if class_matches:
-                indicator_score += len(class_matches) * 0.3
-                found_elements.extend([f"class:{indicator}" for _ in class_matches[:3]])
+                indicator_score += class_matches * 0.3
+                found_elements.extend([f"class:{indicator}"] * min(class_matches, 3))
             
             # Check IDs
-            id_matches = soup.find_all(id=re.compile(indicator, re.IGNORECASE))
+            id_matches = sum(1 for value in page_index['ids'] if regex.search(value))
             if id_matches:
-                indicator_score += len(id_matches) * 0.4
-                found_elements.extend([f"id:{indicator}" for _ in id_matches[:3]])
+                indicator_score += id_matches * 0.4
+                found_elements.extend([f"id:{indicator}"] * min(id_matches, 3))
         
         # Normalize indicator score
         confidence += min(indicator_score / len(indicators), 0.6)
@@ -188,7 +232,7 @@ class PatternRecognizer:
         # Check for expected elements
         element_score = 0
         for element in expected_elements:
-            if self._has_element_pattern(soup, element):
+            if self._has_element_pattern(page_index, element):
                 element_score += 1
                 found_elements.append(element)
         
@@ -197,35 +241,38 @@ class PatternRecognizer:
         
         return min(confidence, 1.0), found_elements
     
-    def _has_element_pattern(self, soup: BeautifulSoup, element_pattern: str) -> bool:
-        """Check if the soup contains a specific element pattern."""
+    def _has_element_pattern(self, page_index: Dict[str, Any], element_pattern: str) -> bool:
+        """Check if the indexed page contains a specific element pattern."""
         element_pattern_lower = element_pattern.lower()
+        tags = page_index['tags']
         
         if element_pattern_lower == 'h1':
-            return bool(soup.find('h1'))
+            return 'h1' in tags
         elif element_pattern_lower == 'h2':
-            return bool(soup.find('h2'))
+            return 'h2' in tags
         elif 'image' in element_pattern_lower:
-            return bool(soup.find('img'))
+            return 'img' in tags
         elif 'button' in element_pattern_lower:
-            return bool(soup.find('button') or soup.find('input', type='submit'))
+            return 'button' in tags or page_index['has_submit_input']
         elif 'form' in element_pattern_lower:
-            return bool(soup.find('form'))
+            return 'form' in tags
         elif 'ul' in element_pattern_lower or 'list' in element_pattern_lower:
-            return bool(soup.find('ul'))
+            return 'ul' in tags
         elif 'grid' in element_pattern_lower:
             # Look for grid-like structures
-            grid_indicators = soup.find_all(class_=re.compile(r'grid|row|col', re.IGNORECASE))
-            return len(grid_indicators) > 2
+            grid_indicators = sum(1 for value in page_index['classes'] if self._grid_regex.search(value))
+            return grid_indicators > 2
         elif 'quote' in element_pattern_lower:
-            return bool(soup.find('blockquote') or soup.find(class_=re.compile('quote', re.IGNORECASE)))
+            return 'blockquote' in tags or any(
+                self._quote_regex.search(value) for value in page_index['classes']
+            )
         elif 'input' in element_pattern_lower:
-            return bool(soup.find('input'))
+            return 'input' in tags
         elif 'link' in element_pattern_lower:
-            return bool(soup.find('a'))
+            return 'a' in tags
         else:
             # Generic text search
-            return element_pattern_lower in soup.get_text().lower()
+            return element_pattern_lower in page_index['text']
     
     def _generate_experience_patterns(self, pattern_occurrences: Dict, site: Site) -> List[ExperiencePattern]:
         """Generate experience patterns from detected occurrences."""
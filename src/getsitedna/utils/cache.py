@@ -14,12 +14,16 @@ from functools import wraps
 from .error_handling import ErrorHandler, SafeExecutor
 
 
+# Per-user cache location, next to the config file, rather than the working directory
+DEFAULT_CACHE_DIR = Path.home() / ".getsitedna" / "cache"
+
+
 class CacheManager:
     """Manager for file-based caching with TTL support."""
     
     def __init__(
         self, 
-        cache_dir: Union[str, Path] = ".getsitedna_cache",
+        cache_dir: Union[str, Path] = DEFAULT_CACHE_DIR,
         default_ttl: int = 3600,  # 1 hour default
         max_size: int = 100 * 1024 * 1024,  # 100MB default
         cleanup_interval: int = 600  # 10 minutes
@@ -33,7 +37,7 @@ class CacheManager:
             cleanup_interval: How often to run cleanup in seconds
         """
         self.cache_dir = Path(cache_dir)
-        self.cache_dir.mkdir(exist_ok=True)
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.default_ttl = default_ttl
         self.max_size = max_size
         self.cleanup_interval = cleanup_interval
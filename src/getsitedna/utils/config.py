@@ -12,7 +12,7 @@ from pydantic import BaseModel, Field
 class CacheConfig:
     """Cache configuration settings."""
     enabled: bool = True
-    cache_dir: str = ".getsitedna_cache"
+    cache_dir: str = str(Path.home() / ".getsitedna" / "cache")
     default_ttl: int = 3600  # 1 hour
     max_size: int = 100 * 1024 * 1024  # 100MB
     cleanup_interval: int = 600  # 10 minutes
@@ -212,6 +212,11 @@ class ErrorHandler:
         if len(self.error_stats["recent_errors"]) > 50:
             self.error_stats["recent_errors"] = self.error_stats["recent_errors"][-50:]
     
+    @property
+    def total_errors(self) -> int:
+        """Number of errors handled so far."""
+        return self.error_stats["total_errors"]
+    
     def get_error_summary(self) -> Dict[str, Any]:
         """Get a summary of error statistics."""
         return self.error_stats.copy()
@@ -228,7 +233,7 @@ class ErrorHandler:
             return False
         
         # Too many total errors
-        if self.error_stats["total_errors"] > 100:
+        if self.total_errors > 100:
             return False
         
         return True
@@ -273,14 +278,16 @@ def retry_on_error(
                         
                 except exceptions as e:
                     last_exception = e
+                    category = getattr(e, "category", None)
                     
                     if error_handler:
                         analysis_error = error_handler.handle_error(e)
+                        category = analysis_error.category
                         if not error_handler.should_continue(analysis_error):
                             break
                     
                     if attempt < config.max_attempts - 1:
-                        delay = calculate_delay(attempt, config)
+                        delay = calculate_delay(attempt, config, category)
                         await asyncio.sleep(delay)
                     
             # All retries exhausted
@@ -300,14 +307,16 @@ def retry_on_error(
                         
                 except exceptions as e:
                     last_exception = e
+                    category = getattr(e, "category", None)
                     
                     if error_handler:
                         analysis_error = error_handler.handle_error(e)
+                        category = analysis_error.category
                         if not error_handler.should_continue(analysis_error):
                             break
                     
                     if attempt < config.max_attempts - 1:
-                        delay = calculate_delay(attempt, config)
+                        delay = calculate_delay(attempt, config, category)
                         time.sleep(delay)
                     
             # All retries exhausted
@@ -326,9 +335,21 @@ def retry_on_error(
     return decorator
 
 
-def calculate_delay(attempt: int, config: RetryConfig) -> float:
-    """Calculate delay for retry attempt."""
-    delay = config.base_delay * (config.exponential_base ** attempt)
+# Failures that will not change by waiting, so they are retried immediately
+IMMEDIATE_RETRY_CATEGORIES = frozenset({ErrorCategory.PARSING, ErrorCategory.VALIDATION})
+
+
+def calculate_delay(attempt: int, config: RetryConfig, category: Optional[ErrorCategory] = None) -> float:
+    """Calculate delay for retry attempt, adjusted for the error category."""
+    if category in IMMEDIATE_RETRY_CATEGORIES:
+        return 0.0
+    
+    if category == ErrorCategory.RATE_LIMIT:
+        # The server asked us to slow down; back off as far as allowed
+        delay = config.max_delay
+    else:
+        delay = config.base_delay * (config.exponential_base ** attempt)
+    
     delay = min(delay, config.max_delay)
     
     if config.jitter:
@@ -29,6 +29,47 @@ class RateLimiter:
         self.last_request_time = time.time()
 
 
+class AsyncTokenBucket:
+    """Token-bucket rate limiter for concurrent requests.
+    
+    Tokens refill at ``rate`` per second up to ``burst``. Each caller reserves
+    a token without awaiting first, so concurrent callers are spaced out at the
+    configured rate instead of being serialized behind one shared delay.
+    """
+    
+    def __init__(self, rate: float, burst: int = 1):
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+    
+    def _refill(self):
+        """Add the tokens accrued since the last refill."""
+        now = time.monotonic()
+        self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.rate)
+        self._last_refill = now
+    
+    def set_rate(self, rate: float, burst: Optional[int] = None):
+        """Change the refill rate, keeping tokens accrued at the old rate.
+        
+        A new ``burst`` also caps the tokens already accrued.
+        """
+        self._refill()
+        self.rate = rate
+        if burst is not None:
+            self.burst = max(1, burst)
+            self._tokens = min(self._tokens, self.burst)
+    
+    async def acquire(self):
+        """Wait until a token is available and take it."""
+        self._refill()
+        self._tokens -= 1
+        
+        # A negative balance is the wait for this caller's reserved token
+        if self._tokens < 0:
+            await asyncio.sleep(-self._tokens / self.rate)
+
+
 class HTTPSession:
     """HTTP session with retry logic and rate limiting."""
     
@@ -86,7 +127,9 @@ class AsyncHTTPSession:
                  timeout: int = 30,
                  concurrent_limit: int = 5,
                  user_agent: Optional[str] = None):
-        self.rate_limiter = RateLimiter(rate_limit_delay)
+        # No burst, so requests are spaced rate_limit_delay apart even at startup
+        # and after idle gaps; concurrency only overlaps the slow responses
+        self.rate_limiter = AsyncTokenBucket(1 / rate_limit_delay)
         self.timeout = aiohttp.ClientTimeout(total=timeout)
         self.concurrent_limit = concurrent_limit
         self.user_agent = user_agent or "GetSiteDNA/0.1.0 (Website Analysis Tool)"
@@ -104,7 +147,11 @@ class AsyncHTTPSession:
         self._session = aiohttp.ClientSession(
             timeout=self.timeout,
             headers=headers,
-            connector=aiohttp.TCPConnector(limit=self.concurrent_limit)
+            connector=aiohttp.TCPConnector(
+                limit=self.concurrent_limit,
+                limit_per_host=self.concurrent_limit,
+                ttl_dns_cache=300,
+            )
         )
         return self
     
@@ -128,7 +175,7 @@ class _AsyncRequestContext:
     
     async def __aenter__(self):
         async with self.session.semaphore:
-            await self.session.rate_limiter.wait()
+            await self.session.rate_limiter.acquire()
             
             if not self.session._session:
                 raise RuntimeError("Session not initialized. Use async with.")
@@ -7,7 +7,7 @@ import gc
 from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
 from typing import Any, Callable, List, Dict, Optional, Tuple, Union
 from dataclasses import dataclass
-from functools import wraps
+from functools import partial, wraps
 import threading
 from contextlib import asynccontextmanager
 
@@ -392,6 +392,30 @@ def performance_optimized(
     return decorator
 
 
+def install_uvloop() -> bool:
+    """Use uvloop's event loop for subsequent ``asyncio.run`` calls if installed.
+    
+    Must be called before the event loop is created. Returns True when uvloop
+    is in use, False when it is unavailable and the default loop is kept.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return False
+    
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+    return True
+
+
+async def run_in_thread(func: Callable, *args, **kwargs) -> Any:
+    """Run a blocking function in the default thread pool and await its result.
+    
+    Equivalent to ``asyncio.to_thread``, which is unavailable on Python 3.8.
+    """
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(None, partial(func, *args, **kwargs))
+
+
 @asynccontextmanager
 async def performance_context(
     enable_monitoring: bool = True,
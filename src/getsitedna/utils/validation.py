@@ -1,22 +1,36 @@
 """URL and input validation utilities."""
 
 import re
+from functools import lru_cache
 from typing import Optional
-from urllib.parse import urlparse, urljoin
+from urllib.parse import urlparse, urlsplit, urljoin
 from pathlib import Path
 
 import validators
+from pydantic import HttpUrl
 
 
+@lru_cache(maxsize=65536)
 def is_valid_url(url: str) -> bool:
-    """Check if a URL is valid."""
+    """Check if a URL is valid (memoized; crawls re-check the same links)."""
     try:
+        # Reject URLs without a scheme or host before the costly regex
+        parts = urlsplit(url)
+        if not parts.scheme or not parts.netloc:
+            return False
+        
         result = validators.url(url)
         return result is True
     except Exception:
         return False
 
 
+@lru_cache(maxsize=65536)
+def http_url(url: str) -> HttpUrl:
+    """Build an HttpUrl, memoized since nav and footer links repeat on every page."""
+    return HttpUrl(url)
+
+
 def normalize_url(url: str) -> str:
     """Normalize a URL by adding protocol and removing trailing slashes."""
     if not url:
@@ -32,11 +46,12 @@ def normalize_url(url: str) -> str:
     return url
 
 
+@lru_cache(maxsize=65536)
 def get_domain(url: str) -> Optional[str]:
     """Extract domain from URL."""
     try:
-        parsed = urlparse(url)
-        return parsed.netloc
+        # urlsplit skips the ;params parsing urlparse does, which netloc never needs
+        return urlsplit(url).netloc
     except Exception:
         return None
 
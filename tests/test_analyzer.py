@@ -0,0 +1,177 @@
+"""Tests for the analysis orchestrator."""
+
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+
+from src.getsitedna.core.analyzer import AnalyzeOptions, SiteAnalyzer, analyze_website
+from src.getsitedna.models.page import Page
+
+
+def _stub_phases(analyzer):
+    """Replace the crawl and analysis phases so analyze_site runs offline."""
+    async def passthrough(site):
+        return site
+    
+    analyzer._crawl_and_analyze = passthrough
+    analyzer._recognize_patterns = passthrough
+    analyzer._discover_apis = passthrough
+    analyzer._generate_outputs = AsyncMock(return_value={})
+    analyzer._calculate_validation_scores = Mock()
+
+
+def _open_browser(analyzer):
+    """Give the analyzer a shared browser and driver, as _get_browser would."""
+    browser = AsyncMock()
+    playwright = AsyncMock()
+    analyzer._browsers = {"chromium": browser}
+    analyzer._playwright = playwright
+    return browser, playwright
+
+
+class TestBrowserLifecycle:
+    """Test the analyzer releases the browsers and pools it keeps open."""
+    
+    @pytest.mark.asyncio
+    async def test_analyze_site_closes_browser_without_context(self):
+        """Test a direct analyze_site call doesn't leave the browser running."""
+        analyzer = SiteAnalyzer(generate_markdown=False)
+        _stub_phases(analyzer)
+        browser, playwright = _open_browser(analyzer)
+        
+        await analyzer.analyze_site("https://example.com")
+        
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+        assert analyzer._browsers == {}
+        assert analyzer._playwright is None
+    
+    @pytest.mark.asyncio
+    async def test_context_keeps_browser_until_exit(self):
+        """Test the browser is reused across runs inside ``async with``."""
+        async with SiteAnalyzer(generate_markdown=False) as analyzer:
+            _stub_phases(analyzer)
+            browser, playwright = _open_browser(analyzer)
+            
+            await analyzer.analyze_site("https://example.com")
+            
+            browser.close.assert_not_awaited()
+        
+        browser.close.assert_awaited_once()
+        playwright.stop.assert_awaited_once()
+    
+    @pytest.mark.asyncio
+    async def test_get_browser_closes_previous_loop_browser(self):
+        """Test browsers from an earlier event loop are shut down, not dropped."""
+        analyzer = SiteAnalyzer()
+        old_browser, old_playwright = _open_browser(analyzer)
+        analyzer._browser_loop = object()
+        
+        new_browser = Mock()
+        with patch('src.getsitedna.core.analyzer.async_playwright') as mock_async_playwright, \
+                patch('src.getsitedna.core.analyzer.launch_browser', AsyncMock(return_value=new_browser)):
+            mock_async_playwright.return_value.start = AsyncMock()
+            browser = await analyzer._get_browser("chromium")
+        
+        old_browser.close.assert_awaited_once()
+        old_playwright.stop.assert_awaited_once()
+        assert browser is new_browser
+    
+    @pytest.mark.asyncio
+    async def test_aclose_shuts_down_process_pool(self):
+        """Test aclose waits for the process pool off the event loop."""
+        analyzer = SiteAnalyzer()
+        pool = Mock()
+        analyzer._cpu_pool = pool
+        
+        with patch('src.getsitedna.core.analyzer.run_in_thread', AsyncMock()) as mock_run_in_thread:
+            await analyzer.aclose()
+        
+        mock_run_in_thread.assert_awaited_once_with(pool.shutdown)
+        assert analyzer._cpu_pool is None
+
+
+class TestAnalysisCache:
+    """Test reuse of cached page analyses."""
+    
+    @pytest.mark.asyncio
+    async def test_cache_hit_skips_extraction(self, sample_page):
+        """Test a cached analysis of identical HTML is restored instead of recomputed."""
+        analyzer = SiteAnalyzer()
+        analyzer._extract_all = AsyncMock()
+        snapshot = analyzer._snapshot_page_analysis(Page(url="https://example.com/"), ["from cache"])
+        
+        with patch('src.getsitedna.core.analyzer.file_cache') as mock_file_cache:
+            mock_file_cache.get = AsyncMock(return_value=snapshot)
+            page = await analyzer._analyze_page(sample_page, "https://example.com/")
+        
+        analyzer._extract_all.assert_not_called()
+        assert "from cache" in page.warnings
+        assert page.analyzed_at is not None
+    
+    @pytest.mark.asyncio
+    async def test_cache_miss_stores_analysis(self, sample_page):
+        """Test a fresh analysis is extracted and stored under the page's key."""
+        analyzer = SiteAnalyzer()
+        analyzer._extract_all = AsyncMock(return_value=(sample_page, []))
+        
+        with patch('src.getsitedna.core.analyzer.file_cache') as mock_file_cache:
+            mock_file_cache.get = AsyncMock(return_value=None)
+            mock_file_cache.set = AsyncMock()
+            await analyzer._analyze_page(sample_page, "https://example.com/")
+        
+        analyzer._extract_all.assert_awaited_once()
+        key = analyzer._analysis_cache_key(sample_page, "https://example.com/")
+        assert mock_file_cache.set.call_args.args[0] == key
+    
+    @pytest.mark.asyncio
+    async def test_no_cache_bypasses_file_cache(self, sample_page):
+        """Test use_cache=False (--no-cache) neither reads nor writes the cache."""
+        analyzer = SiteAnalyzer(use_cache=False)
+        analyzer._extract_all = AsyncMock(return_value=(sample_page, []))
+        
+        with patch('src.getsitedna.core.analyzer.file_cache') as mock_file_cache:
+            mock_file_cache.get = AsyncMock()
+            mock_file_cache.set = AsyncMock()
+            await analyzer._analyze_page(sample_page, "https://example.com/")
+        
+        mock_file_cache.get.assert_not_called()
+        mock_file_cache.set.assert_not_called()
+        analyzer._extract_all.assert_awaited_once()
+    
+    def test_cache_key_scoped_to_version_and_parser(self, sample_page):
+        """Test analyses cached by another release or parser are not reused."""
+        key = SiteAnalyzer()._analysis_cache_key(sample_page, "https://example.com/")
+        
+        with patch('src.getsitedna.core.analyzer.__version__', "0.0.0-other"):
+            assert SiteAnalyzer()._analysis_cache_key(sample_page, "https://example.com/") != key
+        
+        with patch.object(SiteAnalyzer, 'PARSER', "html.parser"):
+            assert SiteAnalyzer()._analysis_cache_key(sample_page, "https://example.com/") != key
+
+
+class TestAnalyzeOptions:
+    """Test the options object for analyze_website."""
+    
+    def test_from_dict_rejects_unknown_keys(self):
+        """Test a misspelled option is reported instead of silently dropped."""
+        with pytest.raises(ValueError, match="use_cahce"):
+            AnalyzeOptions.from_dict({"use_cahce": False})
+    
+    @pytest.mark.asyncio
+    async def test_all_analyzer_options_reach_site_analyzer(self):
+        """Test every SiteAnalyzer option can be set through AnalyzeOptions."""
+        options = AnalyzeOptions.from_dict({
+            "use_process_pool": True,
+            "use_cache": False,
+            "monitor_sample_rate": 0.25,
+        })
+        
+        with patch('src.getsitedna.core.analyzer.SiteAnalyzer') as mock_analyzer_class:
+            analyzer = mock_analyzer_class.return_value.__aenter__.return_value
+            analyzer.analyze_site = AsyncMock()
+            await analyze_website("https://example.com", options)
+        
+        kwargs = mock_analyzer_class.call_args.kwargs
+        assert kwargs["use_process_pool"] is True
+        assert kwargs["use_cache"] is False
+        assert kwargs["monitor_sample_rate"] == 0.25
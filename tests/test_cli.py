@@ -112,6 +112,72 @@ class TestCLIMain:
             
             assert result.exit_code == 0
             assert "Configuration file created" in result.output
+    
+    def test_config_init_keeps_existing_file(self):
+        """Test config init leaves an existing file alone unless --overwrite is given."""
+        runner = CliRunner()
+        
+        with runner.isolated_filesystem():
+            Path("getsitedna.config.json").write_text("{}", encoding="utf-8")
+            
+            result = runner.invoke(cli, ['config', 'init'])
+            
+            assert result.exit_code == 0
+            assert "Config file already exists" in result.output
+            assert Path("getsitedna.config.json").read_text(encoding="utf-8") == "{}"
+            
+            result = runner.invoke(cli, ['config', 'init', '--overwrite'])
+            
+            assert result.exit_code == 0
+            assert "Configuration file created" in result.output
+            assert Path("getsitedna.config.json").read_text(encoding="utf-8") != "{}"
+    
+    @pytest.mark.parametrize("args, use_cache", [([], True), (['--no-cache'], False)])
+    @patch('src.getsitedna.core.analyzer.SiteAnalyzer')
+    def test_analyze_no_cache_reaches_analyzer(self, mock_analyzer_class, args, use_cache):
+        """Test --no-cache turns off the analyzer's page analysis cache."""
+        analyzer = mock_analyzer_class.return_value.__aenter__.return_value
+        analyzer.analyze_site = AsyncMock(return_value=Mock())
+        
+        runner = CliRunner()
+        
+        with runner.isolated_filesystem():
+            runner.invoke(cli, ['analyze', 'https://example.com', *args])
+        
+        mock_analyzer_class.assert_called_once()
+        assert mock_analyzer_class.call_args.kwargs["use_cache"] is use_cache
+    
+    def test_summary_missing_directory(self):
+        """Test summary rejects a missing analysis directory like validate does."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['summary', '/nonexistent/path'])
+        
+        assert result.exit_code == 2
+        assert "Directory '/nonexistent/path' does not exist." in result.output
+    
+    def test_summary_missing_site_data(self, temp_directory):
+        """Test summary reports missing analysis data instead of crashing."""
+        runner = CliRunner()
+        result = runner.invoke(cli, ['summary', str(temp_directory)])
+        
+        assert result.exit_code == 1
+        assert "Analysis data not found" in result.output
+    
+    def test_summary_json_output(self, temp_directory, create_test_files):
+        """Test summary reads the analysis files and writes a JSON summary."""
+        create_test_files(temp_directory, {
+            "site_data.json": {"base_url": "https://example.com/", "domain": "example.com"},
+            "analysis_summary.json": {"validation_score": 0.9},
+        })
+        output_file = temp_directory / "summary.json"
+        
+        runner = CliRunner()
+        result = runner.invoke(cli, ['summary', str(temp_directory), '-f', 'json', '-o', str(output_file)])
+        
+        assert result.exit_code == 0
+        summary = json.loads(output_file.read_text(encoding="utf-8"))
+        assert summary["site_info"]["domain"] == "example.com"
+        assert summary["validation"]["score"] == 0.9
 
 
 class TestValidateCommand:
@@ -130,7 +196,19 @@ class TestValidateCommand:
         runner = CliRunner()
         result = runner.invoke(validate, ['/nonexistent/path'])
         
-        assert result.exit_code != 0
+        assert result.exit_code == 2
+        assert "Directory '/nonexistent/path' does not exist." in result.output
+    
+    def test_validate_file_instead_of_directory(self, temp_directory):
+        """Test validation rejects a path that is a file."""
+        analysis_file = temp_directory / "site_data.json"
+        analysis_file.write_text("{}", encoding="utf-8")
+        
+        runner = CliRunner()
+        result = runner.invoke(validate, [str(analysis_file)])
+        
+        assert result.exit_code == 2
+        assert f"Directory '{analysis_file}' is a file." in result.output
     
     def test_validate_empty_directory(self, temp_directory):
         """Test validation with empty directory."""
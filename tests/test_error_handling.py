@@ -100,6 +100,7 @@ class TestErrorHandler:
         assert handler.error_stats["total_errors"] == 1
         assert handler.error_stats["by_category"]["network"] == 1
         assert handler.error_stats["by_severity"]["high"] == 1
+        assert handler.total_errors == 1
     
     def test_handle_generic_exception(self):
         """Test handling generic Python exceptions."""
@@ -216,6 +217,15 @@ class TestRetryLogic:
         config_with_max = RetryConfig(base_delay=1.0, max_delay=3.0, jitter=False)
         assert calculate_delay(10, config_with_max) == 3.0
     
+    def test_calculate_delay_by_category(self):
+        """Test delay calculation for categorized errors."""
+        config = RetryConfig(base_delay=1.0, max_delay=30.0, jitter=False)
+        
+        assert calculate_delay(2, config, ErrorCategory.PARSING) == 0.0
+        assert calculate_delay(2, config, ErrorCategory.VALIDATION) == 0.0
+        assert calculate_delay(0, config, ErrorCategory.RATE_LIMIT) == 30.0
+        assert calculate_delay(2, config, ErrorCategory.NETWORK) == 4.0
+    
     def test_calculate_delay_with_jitter(self):
         """Test delay calculation with jitter."""
         config = RetryConfig(base_delay=2.0, jitter=True)
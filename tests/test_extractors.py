@@ -7,6 +7,7 @@ from bs4 import BeautifulSoup
 from src.getsitedna.extractors.content import ContentExtractor
 from src.getsitedna.extractors.structure import StructureExtractor
 from src.getsitedna.extractors.design import DesignExtractor
+from src.getsitedna.extractors.api_discovery import APIDiscovery
 from src.getsitedna.processors.html_parser import HTMLParser
 from src.getsitedna.models.schemas import ContentType, ComponentType
 
@@ -338,4 +339,102 @@ class TestDesignExtractor:
         result_site = extractor.analyze_global_design_system(populated_site)
         
         # Should aggregate colors across pages
-        assert len(result_site.global_color_palette) > 0
\ No newline at end of file
+        assert len(result_site.global_color_palette) > 0
+
+
+class TestAPIDiscovery:
+    """Test API endpoint discovery."""
+    
+    def test_data_attribute_extraction(self):
+        """Test extraction of endpoints from data attributes."""
+        html = """
+        <div data-url="/api/v1/users" data-src="/images/logo.png">
+            <button data-action="/ajax/save">Save</button>
+        </div>
+        """
+        discovery = APIDiscovery()
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        endpoints = discovery._extract_from_data_attributes(soup, "https://example.com/")
+        
+        assert endpoints["https://example.com/api/v1/users"]["source"] == "data_attribute_data-url"
+        assert endpoints["https://example.com/ajax/save"]["element"] == "button"
+        assert "https://example.com/images/logo.png" not in endpoints
+    
+    def test_common_endpoint_discovery(self):
+        """Test probing of common API paths."""
+        discovery = APIDiscovery()
+        
+        def head(url, **kwargs):
+            if url.endswith("/graphql"):
+                return Mock(status_code=200, headers={"content-type": "application/json"})
+            if url.endswith("/api"):
+                raise ConnectionError("unreachable")
+            return Mock(status_code=404, headers={})
+        
+        with patch.object(discovery.session, 'head', side_effect=head) as mock_head:
+            endpoints = discovery._discover_common_endpoints("https://example.com")
+        
+        assert list(endpoints) == ["https://example.com/graphql"]
+        assert endpoints["https://example.com/graphql"]["content_type"] == "application/json"
+        assert mock_head.call_count == 14
+    
+    def test_analyze_endpoints_tests_internal_get_endpoints(self):
+        """Test that only internal GET endpoints are probed during analysis."""
+        discovery = APIDiscovery()
+        endpoints = {
+            "https://example.com/api/v1/users",
+            "https://example.com/api/v1/login",
+            "https://other.com/api/v1/items",
+        }
+        metadata = {"https://example.com/api/v1/login": {"method": "POST"}}
+        response = Mock(status_code=401, headers={"content-type": "application/json"})
+        
+        with patch.object(discovery.session, 'head', return_value=response) as mock_head:
+            analyzed = discovery._analyze_endpoints(endpoints, metadata, "https://example.com")
+        
+        mock_head.assert_called_once()
+        users = analyzed["https://example.com/api/v1/users"]
+        assert users["requires_auth"] is True
+        assert users["response_type"] == "JSON"
+        assert "tested" not in analyzed["https://example.com/api/v1/login"]
+        assert analyzed["https://other.com/api/v1/items"]["is_internal"] is False
+    
+    def test_javascript_extraction(self):
+        """Test extraction of endpoints from inline scripts."""
+        html = """
+        <script>
+            fetch('/api/v1/items');
+            xhr.open("post", "/ajax/submit");
+            axios.put(`/rest/orders/1`);
+            $.get('/data/stats');
+            fetch('/about');
+        </script>
+        """
+        discovery = APIDiscovery()
+        soup = BeautifulSoup(html, 'html.parser')
+        
+        endpoints = discovery._extract_from_javascript(soup, "https://example.com/")
+        
+        assert endpoints["https://example.com/api/v1/items"]["source"] == "javascript_fetch"
+        assert endpoints["https://example.com/ajax/submit"]["method"] == "POST"
+        assert endpoints["https://example.com/rest/orders/1"]["source"] == "javascript_axios"
+        assert endpoints["https://example.com/rest/orders/1"]["method"] == "PUT"
+        assert endpoints["https://example.com/data/stats"]["source"] == "javascript_jquery"
+        assert "https://example.com/about" not in endpoints
+    
+    def test_analyze_endpoints_deduplicates_equivalent_urls(self):
+        """Test that equivalent spellings of an endpoint are analyzed once."""
+        discovery = APIDiscovery()
+        endpoints = {
+            "https://example.com/api/v1/users",
+            "https://Example.com:443/api/v1/users/",
+            "https://example.com/api/v1/users#list",
+        }
+        response = Mock(status_code=200, headers={"content-type": "application/json"})
+        
+        with patch.object(discovery.session, 'head', return_value=response) as mock_head:
+            analyzed = discovery._analyze_endpoints(endpoints, {}, "https://example.com")
+        
+        assert list(analyzed) == ["https://example.com/api/v1/users"]
+        mock_head.assert_called_once()